@@ -2,10 +2,12 @@ from PyQt6.QtWidgets import QApplication
 from go import Go
 import sys
 
-app = QApplication([])
+# the search pool workers started with "spawn" import this module again, they must not open a window
+if __name__ == "__main__":
+    app = QApplication([])
 
-with open("HGP_Group_12_Project/code/stylesheet.qss", "r") as f:
-    app.setStyleSheet(f.read())
+    with open("HGP_Group_12_Project/code/stylesheet.qss", "r") as f:
+        app.setStyleSheet(f.read())
 
-myGo = Go()
-sys.exit(app.exec())
+    myGo = Go()
+    sys.exit(app.exec())
@@ -0,0 +1,230 @@
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer, QRect, Qt
+from PyQt6.QtGui import QRegion
+
+
+class FrameClock(QObject):
+    """
+    Single ~60 Hz clock driving every animation of a widget
+    Each frame the animations are advanced by the real elapsed time, the regions they touched
+    are merged and the widget is repainted once, the clock stops when no animation is left
+    """
+
+    FRAME_INTERVAL = 16  # milliseconds between two frames
+
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.widget = widget
+        self.animations = []
+        self.__elapsed = QElapsedTimer()
+        self.__last_frame = 0
+        self.__timer = QTimer(self)
+        self.__timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.__timer.timeout.connect(self.tick)
+
+    def start(self, animation):
+        """
+        Add an animation, the clock is started if it was idle
+        """
+        self.animations.append(animation)
+        if not self.__timer.isActive():
+            self.__elapsed.start()
+            self.__last_frame = 0
+            self.__timer.start(self.FRAME_INTERVAL)
+
+    def stop(self):
+        """
+        Drop every animation and stop the clock
+        """
+        region = QRegion()
+        for animation in self.animations:
+            region = region.united(animation.finish())
+        self.animations = []
+        self.__timer.stop()
+        if not region.isEmpty():
+            self.widget.update(region)
+
+    def tick(self):
+        """
+        Advance all the animations by the time elapsed since the last frame and repaint once
+        """
+        now = self.__elapsed.elapsed()
+        elapsed = (now - self.__last_frame) / 1000
+        self.__last_frame = now
+
+        region = QRegion()
+        running = []
+        for animation in self.animations:
+            region = region.united(animation.advance(elapsed))
+            if animation.finished:
+                region = region.united(animation.finish())
+            else:
+                running.append(animation)
+        self.animations = running
+
+        if not region.isEmpty():
+            self.widget.update(region)
+        if not self.animations:
+            self.__timer.stop()
+
+
+class Animation(object):
+    """
+    Base of the animations run by the FrameClock
+    advance() moves the animation forward and returns the region it touched,
+    finish() cleans up what it drew and returns the region to repaint
+    """
+
+    def __init__(self):
+        self.time = 0.0  # seconds since the start of the animation
+        self.finished = False
+
+    def advance(self, elapsed):
+        self.time += elapsed
+        return QRegion()
+
+    def finish(self):
+        self.finished = True
+        return QRegion()
+
+
+class CaptureAnimation(Animation):
+    """
+    Captured stones lifted slightly, held for a moment, then slid out of the board to the right
+    """
+
+    LIFT = 10  # pixels the stones are lifted by
+    HOLD_DURATION = 0.7  # seconds before sliding out
+    SLIDE_DURATION = 1.0  # seconds to slide one board width
+
+    def __init__(self, board, pieces):
+        super().__init__()
+        self.board = board
+        self.pieces = pieces
+        self.start_x = [captured["x"] for captured in pieces]
+        for captured in pieces:
+            captured["y"] -= self.LIFT
+        board.captured_pieces.extend(pieces)
+
+    def region(self):
+        region = QRegion()
+        for captured in self.pieces:
+            region = region.united(
+                QRegion(self.board.spriteRect(captured["x"], captured["y"]))
+            )
+        return region
+
+    def advance(self, elapsed):
+        region = self.region()
+        super().advance(elapsed)
+
+        progress = (self.time - self.HOLD_DURATION) / self.SLIDE_DURATION
+        if progress >= 1:
+            self.finished = True
+        progress = min(max(progress, 0.0), 1.0)
+
+        for captured, start_x in zip(self.pieces, self.start_x):
+            captured["x"] = start_x + progress * self.board.square_side
+
+        return region.united(self.region())
+
+    def finish(self):
+        super().finish()
+        region = self.region()
+        self.board.captured_pieces = [
+            captured
+            for captured in self.board.captured_pieces
+            if captured not in self.pieces
+        ]
+        return region
+
+
+class FireworksAnimation(Animation):
+    """
+    Particles thrown upward from random points of the board, kept as a structure of NumPy
+    arrays so that thousands of them are moved and culled in a few vectorized operations
+    The speeds are given per reference frame of 10 ms and scaled by the real elapsed time
+    The board draws them in its own pass with a single cached sprite
+    """
+
+    PARTICLES = 2000
+    REFERENCE_FRAME = 0.010  # seconds
+    GRAVITY = 0.05  # speed change per reference frame
+
+    def __init__(self, board, particles=PARTICLES):
+        super().__init__()
+        self.board = board
+        generator = np.random.default_rng()
+
+        self.x = generator.uniform(
+            board.top_left_x, board.top_left_x + board.square_side, particles
+        )
+        self.y = generator.uniform(
+            board.top_left_y, board.top_left_y + board.square_side, particles
+        )
+        self.vx = generator.uniform(-2, 2, particles)  # Random velocity
+        self.vy = generator.uniform(-3, -1, particles)  # Negative for upward motion
+        # Lifespan in reference frames
+        self.lifetime = generator.uniform(200, 500, particles)
+
+        board.fireworks = self
+
+    def __len__(self):
+        return len(self.x)
+
+    def region(self):
+        """
+        Bounding rectangle of all the particles, one rectangle is cheaper than thousands
+        """
+        if not len(self):
+            return QRegion()
+        margin = self.board.particle_size
+        left, right = int(self.x.min()) - margin, int(self.x.max()) + margin
+        top, bottom = int(self.y.min()) - margin, int(self.y.max()) + margin
+        return QRegion(QRect(left, top, right - left + 1, bottom - top + 1))
+
+    def advance(self, elapsed):
+        region = self.region()
+        super().advance(elapsed)
+        frames = elapsed / self.REFERENCE_FRAME
+
+        self.x += self.vx * frames
+        self.y += self.vy * frames
+        self.vy -= self.GRAVITY * frames  # Gravity effect
+        self.lifetime -= frames
+
+        # Remove dead particles and the ones that left the widget
+        margin = self.board.particle_size
+        alive = (
+            (self.lifetime > 0)
+            & (self.x > -margin)
+            & (self.x < self.board.width() + margin)
+            & (self.y > -margin)
+            & (self.y < self.board.height() + margin)
+        )
+        if not alive.all():
+            self.x, self.y = self.x[alive], self.y[alive]
+            self.vx, self.vy = self.vx[alive], self.vy[alive]
+            self.lifetime = self.lifetime[alive]
+
+        if not len(self):
+            self.finished = True
+
+        return region.united(self.region())
+
+    def positions(self):
+        """
+        Return the top left corners of the particle sprites as two lists of integers
+        """
+        offset = self.board.particle_size / 2
+        return (
+            (self.x - offset).astype(np.int32).tolist(),
+            (self.y - offset).astype(np.int32).tolist(),
+        )
+
+    def finish(self):
+        super().finish()
+        region = self.region()
+        if self.board.fireworks is self:
+            self.board.fireworks = None
+        return region
@@ -0,0 +1,293 @@
+import argparse
+import json
+import os
+import random
+import time
+from piece import Piece
+from goban import Goban
+from game_logic import GameLogic
+from mcts import MonteCarloTreeSearch, ParallelSearch
+
+SIZES = [9, 13, 19]
+GAMES = 3  # seeded random games played for each size
+POSITIONS_PER_GAME = 8  # positions recorded along each game
+CALLS_PER_POSITION = 200  # calls of each entry point on a recorded position
+
+# entry points timed while the games are played, then on the recorded positions
+MOVE_ENTRY_POINTS = ["legal_moves", "capturing_territory", "count_territory"]
+POSITION_ENTRY_POINTS = [
+    "check_piece_placement",
+    "ko",
+    "suicide",
+    "is_encircled",
+    "make_unmake_move",
+    "territory_scoring",
+    "area_scoring",
+]
+
+
+def new_game(size):
+    logic = GameLogic(
+        Goban(size),
+        {
+            "player": 0,
+            "type": None,
+            "value": None,
+            "komi": "6.5",
+            "ko": "Simple ko",
+            "size": size,
+        },
+    )
+    logic.start()
+    return logic
+
+
+def timed(timings, name, function, *args):
+    """
+    Call the function and add its duration in nanoseconds to the timings of the entry point
+    """
+    start = time.perf_counter_ns()
+    result = function(*args)
+    timings[name].append(time.perf_counter_ns() - start)
+    return result
+
+
+def play_random_game(size, seed, timings):
+    """
+    Play a seeded random game like the Board widget does, timing the engine calls of every move,
+    return the moves played and the move numbers where positions are recorded
+    """
+    generator = random.Random(seed)
+    logic = new_game(size)
+    points = logic.board.points()
+    player_turn = 2
+    moves = []
+
+    for _ in range(2 * size * size):
+        mask = timed(timings, "legal_moves", logic.legal_moves, player_turn)
+
+        # random choice of the player, not timed
+        legal_points = [point for point in points if mask[point]]
+        if not legal_points:
+            break
+        new_piece = Piece(
+            player_turn, *logic.board.position(generator.choice(legal_points))
+        )
+
+        timed(timings, "capturing_territory", logic.capturing_territory, new_piece)
+        timed(timings, "count_territory", logic.count_territory)
+        moves.append(new_piece)
+        player_turn = 3 - player_turn
+
+    step = max(1, len(moves) // POSITIONS_PER_GAME)
+    return moves, range(step, len(moves) + 1, step)
+
+
+def load_position(size, moves):
+    """
+    Replay the moves of a recorded game on a new engine
+    """
+    logic = new_game(size)
+    for new_piece in moves:
+        logic.capturing_territory(new_piece)
+    logic.count_territory()
+    return logic
+
+
+def time_position(logic, player_turn, generator, timings):
+    """
+    Time the position entry points with random pieces on the recorded position
+    """
+    board = logic.board
+    empty_points = [point for point in board.points() if board.cells[point] == 0]
+    legal_points = [
+        point for point in empty_points if logic.legal_moves(player_turn)[point]
+    ]
+
+    for _ in range(CALLS_PER_POSITION):
+        if empty_points:
+            new_piece = Piece(
+                generator.choice((1, 2)),
+                *board.position(generator.choice(empty_points)),
+            )
+            timed(
+                timings, "check_piece_placement", logic.check_piece_placement, new_piece
+            )
+            timed(timings, "ko", logic.ko, new_piece)
+            timed(timings, "suicide", logic.suicide, new_piece)
+            timed(timings, "is_encircled", logic.is_encircled, new_piece)
+
+        if legal_points:
+            row, col = board.position(generator.choice(legal_points))
+            start = time.perf_counter_ns()
+            logic.unmake_move(logic.make_move(row, col, player_turn))
+            timings["make_unmake_move"].append(time.perf_counter_ns() - start)
+
+        timed(timings, "territory_scoring", logic.territory_scoring)
+        timed(timings, "area_scoring", logic.area_scoring)
+
+
+def run(sizes):
+    """
+    Run the benchmark for every size, return {size: {entry point: statistics}}
+    """
+    results = {}
+    for size in sizes:
+        timings = {name: [] for name in MOVE_ENTRY_POINTS + POSITION_ENTRY_POINTS}
+        for seed in range(GAMES):
+            moves, recorded = play_random_game(size, seed, timings)
+            generator = random.Random(seed)
+            for move_number in recorded:
+                logic = load_position(size, moves[:move_number])
+                time_position(
+                    logic, 3 - moves[move_number - 1].state, generator, timings
+                )
+
+        results[str(size)] = {
+            name: statistics(samples) for name, samples in timings.items() if samples
+        }
+    return results
+
+
+def playout_rate(size, thinking_time, workers=1):
+    """
+    Search the empty board with the computer player, return its playouts per second
+    """
+    logic = new_game(size)
+    if workers > 1:
+        search = ParallelSearch(size, (6.5, 0), workers)
+    else:
+        search = MonteCarloTreeSearch(size, (6.5, 0), seed=0)
+    search.search(
+        logic.board.cells, 2, logic.legal_moves(2), thinking_time=thinking_time
+    )
+    search.close()
+    return {
+        "workers": workers,
+        "playouts": search.playouts,
+        "playouts_per_sec": search.playouts_per_second(),
+    }
+
+
+def search_scaling(size, thinking_time, max_workers):
+    """
+    Search the empty board with 1, 2, 4... processes up to max_workers, return the playouts
+    per second of each count and the speedup over a single process
+    """
+    logic = new_game(size)
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+
+    rates = {}
+    for workers in counts:
+        search = ParallelSearch(size, (6.5, 0), workers)
+        search.search(
+            logic.board.cells, 2, logic.legal_moves(2), thinking_time=thinking_time
+        )
+        search.close()
+        rates[workers] = search.playouts_per_second()
+    return [
+        {
+            "workers": workers,
+            "playouts_per_sec": rate,
+            "speedup": rate / rates[1],
+            "efficiency": rate / rates[1] / workers,
+        }
+        for workers, rate in rates.items()
+    ]
+
+
+def statistics(samples):
+    samples = sorted(samples)
+
+    def percentile(rank):
+        return samples[min(len(samples) - 1, int(len(samples) * rank))] / 1000
+
+    return {
+        "calls": len(samples),
+        "ops_per_sec": len(samples) / (sum(samples) / 1e9),
+        "p50_us": percentile(0.50),
+        "p90_us": percentile(0.90),
+        "p99_us": percentile(0.99),
+    }
+
+
+def report(results, baseline=None):
+    for size, entry_points in results.items():
+        print(f"\n{size}x{size}")
+        header = f"{'entry point':<24}{'calls':>8}{'ops/sec':>12}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}"
+        print(header + (f"{'vs baseline':>14}" if baseline else ""))
+        for name, stats in entry_points.items():
+            line = (
+                f"{name:<24}{stats['calls']:>8}{stats['ops_per_sec']:>12.0f}"
+                f"{stats['p50_us']:>10.1f}{stats['p90_us']:>10.1f}{stats['p99_us']:>10.1f}"
+            )
+            if baseline and name in baseline.get(size, {}):
+                speedup = stats["ops_per_sec"] / baseline[size][name]["ops_per_sec"]
+                line += f"{speedup:>13.2f}x"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark of the rules engine hot paths"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--save", help="save the results as a JSON baseline")
+    parser.add_argument(
+        "--compare", help="compare the results with a saved JSON baseline"
+    )
+    parser.add_argument(
+        "--search-time",
+        type=float,
+        default=2.0,
+        help="seconds of search for the 9x9 playout rate",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="processes of the 9x9 search"
+    )
+    parser.add_argument(
+        "--scaling",
+        type=int,
+        nargs="?",
+        const=os.cpu_count() or 1,
+        help="also time the 9x9 search with 1, 2, 4... processes up to this count, all the cores by default",
+    )
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+    playouts = playout_rate(9, args.search_time, args.workers)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+    report(results, baseline)
+    line = f"\nMCTS on 9x9 with {playouts['workers']} workers: {playouts['playouts']} playouts, {playouts['playouts_per_sec']:.0f} playouts/sec"
+    if baseline and "mcts_9" in baseline:
+        line += f" ({playouts['playouts_per_sec'] / baseline['mcts_9']['playouts_per_sec']:.2f}x vs baseline)"
+    print(line)
+    results["mcts_9"] = playouts
+
+    if args.scaling:
+        scaling = search_scaling(9, args.search_time, args.scaling)
+        print(f"\n{'workers':>8}{'playouts/sec':>14}{'speedup':>9}{'efficiency':>12}")
+        for entry in scaling:
+            print(
+                f"{entry['workers']:>8}{entry['playouts_per_sec']:>14.0f}"
+                f"{entry['speedup']:>8.2f}x{entry['efficiency']:>11.0%}"
+            )
+        results["mcts_9_scaling"] = scaling
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved in {args.save}")
+
+
+if __name__ == "__main__":
+    main()
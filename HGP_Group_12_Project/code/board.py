@@ -7,13 +7,23 @@ from PyQt6.QtWidgets import (
     QStackedWidget,
     QVBoxLayout,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPoint, QSize
-from PyQt6.QtGui import QPainter, QColor, QBrush, QPixmap, QKeyEvent
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, pyqtSignal, QPoint, QSize, QRect
+from PyQt6.QtGui import QPainter, QColor, QBrush, QPixmap, QKeyEvent, QRadialGradient
 from piece import Piece
+from goban import Goban
 from game_logic import GameLogic
 from copy import deepcopy
 from handicap import HandicapDialog
-import random
+from animation import FrameClock, CaptureAnimation, FireworksAnimation
+from replay import GameReplay
+from game_database import GameDatabase
+from mcts import MonteCarloTreeSearch, computer_search
+from search_job import SearchJob, SearchToken
+from datetime import date, datetime
+import sgf
+import game_record
+import sqlite3
+import time
 
 
 class Board(QFrame):
@@ -22,12 +32,20 @@ class Board(QFrame):
     resetGameSignal = pyqtSignal()
     returnToMenuSignal = pyqtSignal()
 
-    boardWidth = 9  # 9x9 Goban
+    boardWidth = 9  # 9x9 Goban by default, chosen with the handicaps
     boardHeight = 9
 
     gamemode = 0
     winner = 0
 
+    computer_player = None  # player moved by the computer, None between two humans
+    # seconds the computer searches each move
+    thinking_time = MonteCarloTreeSearch.THINKING_TIME
+    pondering = True  # the computer keeps searching while the player thinks
+
+    show_coordinates = False  # letters and numbers around the grid
+    coordinate_letters = "ABCDEFGHJKLMNOPQRSTUVWXYZ"  # no I, like on a real goban
+
     def __init__(self, parent=None, scoreBoard=None):
         super().__init__(parent)
         self.margin = 50
@@ -54,30 +72,66 @@ class Board(QFrame):
         if self.black_stone_pixmap.isNull():
             print("Failed to load black_stone.png")
 
+        # Assets scaled to the widget, rebuilt only on resize or pixel ratio change
+        self.render_cache_key = None
+        self.stone_sprites = {1: QPixmap(), 2: QPixmap()}
+        self.stone_size = 0
+        self.particle_sprite = QPixmap()
+        self.particle_size = 0
+
+        # Static layer of the goban, rebuilt on resize, theme or board size change
+        self.board_layer_key = None
+        self.board_layer = QPixmap()
+
         self.captured_pieces = []  # List to track captured pieces
-        self.capture_timer = QTimer(self)
-        self.capture_timer.timeout.connect(
-            self.slideOutCapturedPieces
-        )  # Timer for sliding animation
+        # Particles of the victory animation, drawn by drawFireworks
+        self.fireworks = None
+        # Drives the capture and fireworks animations
+        self.frame_clock = FrameClock(self)
 
         self.hover_row = -1  # Default no hover
         self.hover_col = -1  # Default no hover
+        self.hover_intersection = None  # Last intersection resolved under the mouse
+        # Last mouse position, resolved at most once per frame
+        self.hover_position = None
+        self.hover_timer = QTimer(self)
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(FrameClock.FRAME_INTERVAL)
+        self.hover_timer.timeout.connect(self.resolveHover)
         self.transparent_piece_color = (
             1  # Default hover as white (1 for white, 2 for black)
         )
         self.setMouseTracking(True)  # Enable mouse tracking
 
+        self.replay = None  # GameReplay shown while scrubbing through the played moves
+
+        self.computer = None  # ParallelSearch of the computer player
+        # Runs the searches off the GUI thread, one at a time
+        self.search_pool = QThreadPool(self)
+        self.search_pool.setMaxThreadCount(1)
+        self.search_token = None  # SearchToken of the running search, cancelled when the position changes
+        self.search_job = None
+        # playouts per second of the last search of the computer move
+        self.computer_rate = 0
+        self.database = None  # Finished games, opened when the first game ends
+        # Start of the current game, for its duration
+        self.start_time = time.monotonic()
+
         self.pending_move = None  # Store the pending move
         self.clicked_position = None  # Store the clicked position
 
-        self.handicap = {"player": 0, "type": None, "value": None, "komi": "6.5"}
+        self.handicap = {
+            "player": 0,
+            "type": None,
+            "value": None,
+            "komi": "6.5",
+            "ko": "Simple ko",
+            "size": 9,
+        }
 
     def initBoard(self):
         """Initializes the board."""
-        self.boardArray = [
-            [Piece(0, r, c) for c in range(self.boardWidth)]
-            for r in range(self.boardHeight)
-        ]
+        self.boardArray = Goban(self.boardWidth)
         self.printBoardArray()
         self.player_turn = 2  # black starts
         self.conssecutive_passing_turn = 0
@@ -88,8 +142,8 @@ class Board(QFrame):
         print(
             "\n".join(
                 [
-                    "\t".join([str(cell.state) for cell in row])
-                    for row in self.boardArray
+                    "\t".join([str(state) for state in row])
+                    for row in self.boardArray.rows()
                 ]
             )
         )
@@ -102,20 +156,31 @@ class Board(QFrame):
 
     def paintEvent(self, event):
         painter = QPainter(self)
+        exposed = event.rect()  # only this region needs to be drawn again
 
         # Calculate the square playable area within the margins
         side = min(self.width() - 2 * self.margin, self.height() - 2 * self.margin)
         self.square_side = side
         self.top_left_x = (self.width() - side) // 2
         self.top_left_y = (self.height() - side) // 2
+        self.updateRenderCache()
+        self.updateBoardLayer()
+
+        # Background, grid, stars and coordinates drawn once in the static layer
+        ratio = self.board_layer.devicePixelRatio()
+        painter.drawPixmap(
+            exposed,
+            self.board_layer,
+            QRect(
+                int(exposed.x() * ratio),
+                int(exposed.y() * ratio),
+                int(exposed.width() * ratio),
+                int(exposed.height() * ratio),
+            ),
+        )
 
-        # Draw the background to fill the entire widget
-        self.drawBackground(painter)
-
-        # Draw the board grid and pieces
-        self.drawBoardLines(painter)
-        self.drawStars(painter)
-        self.drawPieces(painter)
+        # Draw the pieces
+        self.drawPieces(painter, exposed)
 
         # Draw hover pieces
         self.drawHoverPiece(painter)
@@ -123,21 +188,169 @@ class Board(QFrame):
         # Draw captured pieces
         self.drawCapturedPieces(painter)
 
+        # Draw the victory fireworks
+        self.drawFireworks(painter)
+
         # if hasattr(self, "highlight_positions") and self.highlight_positions:
         #   self.highlightPieces(painter, self.highlight_positions)
         self.highlightPieces(painter)
 
+    def updateRenderCache(self):
+        """Scale the background and the stones once for the current widget size, square size and pixel ratio."""
+        ratio = self.devicePixelRatioF()
+        stone_size = int(self.square_side / (self.boardWidth - 1) * 0.9)
+        key = (self.width(), self.height(), stone_size, ratio)
+        if key == self.render_cache_key:
+            return
+
+        self.render_cache_key = key
+        self.stone_size = stone_size
+        self.stone_sprites = {
+            1: self.scaledSprite(
+                self.white_stone_pixmap, stone_size, stone_size, ratio
+            ),
+            2: self.scaledSprite(
+                self.black_stone_pixmap, stone_size, stone_size, ratio
+            ),
+        }
+        self.particle_size = max(4, stone_size // 4)
+        self.particle_sprite = self.particleSprite(self.particle_size, ratio)
+
+    def updateBoardLayer(self):
+        """Compose the background, the grid, the stars and the coordinates in an offscreen pixmap."""
+        ratio = self.devicePixelRatioF()
+        key = (
+            self.width(),
+            self.height(),
+            ratio,
+            self.boardWidth,
+            self.boardHeight,
+            self.show_coordinates,
+            self.background_pixmap.cacheKey(),
+        )
+        if key == self.board_layer_key:
+            return
+
+        self.board_layer_key = key
+        self.board_layer = QPixmap(
+            max(1, int(self.width() * ratio)), max(1, int(self.height() * ratio))
+        )
+        self.board_layer.setDevicePixelRatio(ratio)
+        self.board_layer.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(self.board_layer)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.drawBackground(painter)
+        self.drawBoardLines(painter)
+        self.drawStars(painter)
+        if self.show_coordinates:
+            self.drawCoordinates(painter)
+        painter.end()
+
+    def invalidateBoardLayer(self):
+        """Force the static layer to be composed again on the next paint."""
+        self.board_layer_key = None
+        self.update()
+
+    def setTheme(self, background_path):
+        """Change the background image of the goban, return False if the image can't be loaded."""
+        background_pixmap = QPixmap(background_path)
+        if background_pixmap.isNull():
+            print(f"Failed to load {background_path}")
+            return False
+        self.background_pixmap = background_pixmap
+        self.invalidateBoardLayer()
+        return True
+
+    def setShowCoordinates(self, show):
+        """Show or hide the coordinates around the grid."""
+        self.show_coordinates = show
+        self.invalidateBoardLayer()
+
+    def particleSprite(self, size, ratio):
+        """Return a small glowing dot used for every firework particle."""
+        sprite = QPixmap(max(1, int(size * ratio)), max(1, int(size * ratio)))
+        sprite.setDevicePixelRatio(ratio)
+        sprite.fill(Qt.GlobalColor.transparent)
+
+        gradient = QRadialGradient(size / 2, size / 2, size / 2)
+        gradient.setColorAt(0.0, QColor(255, 250, 220, 255))
+        gradient.setColorAt(0.4, QColor(255, 200, 60, 220))
+        gradient.setColorAt(1.0, QColor(255, 120, 0, 0))
+
+        painter = QPainter(sprite)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawEllipse(0, 0, size, size)
+        painter.end()
+        return sprite
+
+    def scaledSprite(self, pixmap, width, height, ratio):
+        """Return the pixmap scaled to the given logical size for the device pixel ratio."""
+        if pixmap.isNull():
+            return pixmap
+
+        sprite = pixmap.scaled(
+            QSize(max(1, int(width * ratio)), max(1, int(height * ratio))),
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        sprite.setDevicePixelRatio(ratio)
+        return sprite
+
+    def stonePosition(self, row, col):
+        """Return the top left corner of a stone sprite centered on the intersection."""
+        square_width = self.square_side / (self.boardWidth - 1)
+        square_height = self.square_side / (self.boardHeight - 1)
+
+        x = self.top_left_x + col * square_width - self.stone_size / 2
+        y = self.top_left_y + row * square_height - self.stone_size / 2
+        return int(x), int(y)
+
+    def cellRect(self, row, col):
+        """Return the widget area covered by a stone or a highlight on the intersection."""
+        square_width = self.square_side / (self.boardWidth - 1)
+        square_height = self.square_side / (self.boardHeight - 1)
+        side = int(max(square_width, square_height)) + 2
+
+        x = int(self.top_left_x + col * square_width) - side // 2
+        y = int(self.top_left_y + row * square_height) - side // 2
+        return QRect(x, y, side, side)
+
+    def spriteRect(self, x, y):
+        """Return the widget area covered by a stone sprite centered on the given point."""
+        side = self.stone_size + 2
+        return QRect(int(x) - side // 2, int(y) - side // 2, side, side)
+
+    def updateCell(self, row, col):
+        """Schedule the repaint of a single intersection."""
+        if row != -1 and col != -1:
+            self.update(self.cellRect(row, col))
+
+    def updatePendingCell(self):
+        """Schedule the repaint of the pending move currently shown, if any."""
+        if self.pending_moves:
+            move = self.pending_moves[self.current_pending_index]
+            self.updateCell(move["row"], move["col"])
+
+    def visibleCells(self, exposed):
+        """Return the rows and the columns of the intersections that may cross the exposed region."""
+        square_width = self.square_side / (self.boardWidth - 1)
+        square_height = self.square_side / (self.boardHeight - 1)
+
+        first_col = int((exposed.left() - self.top_left_x) / square_width - 1)
+        last_col = int((exposed.right() - self.top_left_x) / square_width + 2)
+        first_row = int((exposed.top() - self.top_left_y) / square_height - 1)
+        last_row = int((exposed.bottom() - self.top_left_y) / square_height + 2)
+
+        rows = range(max(0, first_row), min(self.boardHeight, last_row + 1))
+        cols = range(max(0, first_col), min(self.boardWidth, last_col + 1))
+        return rows, cols
+
     def drawBackground(self, painter):
         """Draw the background image covering the entire widget."""
         if not self.background_pixmap.isNull():
-            painter.drawPixmap(
-                self.rect(),
-                self.background_pixmap.scaled(
-                    self.size(),
-                    Qt.AspectRatioMode.IgnoreAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                ),
-            )
+            painter.drawPixmap(self.rect(), self.background_pixmap)
 
     def mousePressEvent(self, event):
         """This event is automatically called when the mouse is pressed"""
@@ -152,6 +365,9 @@ class Board(QFrame):
         ):
             return  # Ignore clicks outside the square board
 
+        if self.replay is not None:
+            return  # No move while reviewing the game
+
         square_width = self.square_side / (self.boardWidth - 1)
         square_height = self.square_side / (self.boardHeight - 1)
         col = round((event.position().x() - self.top_left_x) / square_width)
@@ -160,7 +376,13 @@ class Board(QFrame):
         # Ensure the click is within the board boundaries
         if self.logic.existing_position(row, col):
 
-            piece = self.boardArray[row][col]
+            piece = self.boardArray[row, col]
+
+            if (
+                self.logic.game_state() == 1
+                and self.player_turn == self.computer_player
+            ):
+                return  # The computer is thinking
 
             if self.logic.game_state() == 1 and piece.state == 0:
 
@@ -179,19 +401,17 @@ class Board(QFrame):
 
                 if check and self.gamemode == 0:
 
+                    self.updatePendingCell()
                     self.pending_moves.append(
                         {"row": row, "col": col, "piece": new_piece}
                     )
                     self.current_pending_index = len(self.pending_moves) - 1
-                    self.update()
+                    self.updatePendingCell()
 
                 elif check and self.gamemode == 1:
 
-                    piece = self.boardArray[row][col]
-                    piece.change_state(self.player_turn)  # Finalize the move
-
-                    # Handle capturing logic
-                    captured_positions = self.logic.capturing_territory(piece)
+                    # Finalize the move and handle capturing logic
+                    captured_positions = self.logic.capturing_territory(new_piece)
 
                     if captured_positions:
                         self.handleCapturedPieces(captured_positions)
@@ -217,10 +437,22 @@ class Board(QFrame):
                 # TODO implement glowing piece like surround them in blue ?
                 self.positions = neighbor_pieces_positions
 
-                captured_positions = self.logic.remove_dead_pieces_box(
-                    self.player_turn, neighbor_pieces_positions
+                message_box = QMessageBox()
+                message_box.setWindowTitle("Concede Pieces")
+                message_box.setText(
+                    f"{Piece(3 - self.player_turn).name} player, do you concede that the selected pieces are dead?"
+                )
+                message_box.setStandardButtons(
+                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
                 )
 
+                if message_box.exec() == QMessageBox.StandardButton.Yes:
+                    captured_positions = self.logic.remove_dead_pieces(
+                        self.player_turn, neighbor_pieces_positions
+                    )
+                else:
+                    captured_positions = None
+
                 if captured_positions:
                     self.setMouseTracking(False)
                     self.positions = []
@@ -232,25 +464,32 @@ class Board(QFrame):
                 else:
                     self.logic.dead_pieces_debate()
 
+                    message_box = QMessageBox()
+                    message_box.setWindowTitle("Dispute mode")
+                    message_box.setText("Starting the dispute mode.")
+                    message_box.exec()
+
     def PreviousPendingMove(self):
         """Go to the previous pending move."""
         if not self.pending_moves:
             return
 
+        self.updatePendingCell()
         if self.current_pending_index > 0:
             self.current_pending_index -= 1
 
-        self.update()
+        self.updatePendingCell()
 
     def NextPendingMove(self):
         """Go to the next pending move."""
         if not self.pending_moves:
             return
 
+        self.updatePendingCell()
         if self.current_pending_index < len(self.pending_moves) - 1:
             self.current_pending_index += 1
 
-        self.update()
+        self.updatePendingCell()
 
     def confirmMove(self):
         """Confirm the pending move and finalize the turn."""
@@ -261,10 +500,8 @@ class Board(QFrame):
         move = self.pending_moves[self.current_pending_index]
 
         row, col = move["row"], move["col"]
-        piece = self.boardArray[row][col]
-        piece.change_state(self.player_turn)  # Finalize the move
 
-        # Handle capturing logic
+        # Finalize the move and handle capturing logic
         captured_positions = self.logic.capturing_territory(move["piece"])
 
         if captured_positions:
@@ -278,60 +515,62 @@ class Board(QFrame):
         self.update_turn()
 
     def mouseMoveEvent(self, event):
-        """Track the mouse position and determine the hovered position."""
+        """Track the mouse position, the hovered position is resolved once per frame."""
         if self.logic.game_state() == 1:
-            mouse_x, mouse_y = event.position().x(), event.position().y()
+            self.hover_position = event.position()
+            if not self.hover_timer.isActive():
+                self.hover_timer.start()
+
+    def resolveHover(self, force=False):
+        """Determine the hovered position, nothing is done while the mouse stays on the same intersection."""
+        if (
+            self.hover_position is None
+            or self.logic.game_state() != 1
+            or self.replay is not None
+        ):
+            return
 
-            square_width = self.square_side / (self.boardWidth - 1)
-            square_height = self.square_side / (self.boardHeight - 1)
+        square_width = self.square_side / (self.boardWidth - 1)
+        square_height = self.square_side / (self.boardHeight - 1)
 
-            col = round((mouse_x - self.top_left_x) / square_width)
-            row = round((mouse_y - self.top_left_y) / square_height)
+        col = round((self.hover_position.x() - self.top_left_x) / square_width)
+        row = round((self.hover_position.y() - self.top_left_y) / square_height)
 
-            # Validate hover position
-            if self.logic.existing_position(row, col):
-                if (
-                    self.logic.check_piece_placement(
-                        Piece(self.player_turn, row, col), hover=True
-                    )
-                    and self.boardArray[row][col].state == 0
-                ):  # Only hover if position is empty and respect game rules
-                    self.hover_row = row
-                    self.hover_col = col
-                else:
-                    self.hover_row = -1
-                    self.hover_col = -1
+        if (row, col) == self.hover_intersection and not force:
+            return
+        self.hover_intersection = (row, col)
+
+        # Repaint the previous hover position
+        self.updateCell(self.hover_row, self.hover_col)
+
+        # Validate hover position
+        if self.logic.existing_position(row, col):
+            if self.legal_mask[
+                self.boardArray.point(row, col)
+            ]:  # Only hover if position is empty and respect game rules
+                self.hover_row = row
+                self.hover_col = col
             else:
                 self.hover_row = -1
                 self.hover_col = -1
+        else:
+            self.hover_row = -1
+            self.hover_col = -1
 
-            self.update()  # Trigger repaint
+        # Repaint the new hover position
+        self.updateCell(self.hover_row, self.hover_col)
 
     def drawHoverPiece(self, painter):
         """Draw a semi-transparent piece at the hovered position if valid."""
         if self.hover_row == -1 or self.hover_col == -1 or self.logic.game_state() != 1:
             return
 
-        square_width = self.square_side / (self.boardWidth - 1)
-        square_height = self.square_side / (self.boardHeight - 1)
-
-        center_x = self.top_left_x + self.hover_col * square_width
-        center_y = self.top_left_y + self.hover_row * square_height
-        size = min(square_width, square_height) * 0.9
-
         self.transparent_piece_color = self.player_turn
 
-        pixmap = (
-            self.white_stone_pixmap
-            if self.transparent_piece_color == 1
-            else self.black_stone_pixmap
-        )
-
-        x = center_x - size / 2
-        y = center_y - size / 2
+        x, y = self.stonePosition(self.hover_row, self.hover_col)
 
         painter.setOpacity(0.5)  # Semi-transparent effect
-        painter.drawPixmap(int(x), int(y), int(size), int(size), pixmap)
+        painter.drawPixmap(x, y, self.stone_sprites[self.transparent_piece_color])
         painter.setOpacity(1.0)  # Reset opacity to normal
 
     def drawClickedPiece(self, painter):
@@ -340,26 +579,13 @@ class Board(QFrame):
             return
 
         row, col = self.clicked_position
-        square_width = self.square_side / (self.boardWidth - 1)
-        square_height = self.square_side / (self.boardHeight - 1)
-
-        center_x = self.top_left_x + col * square_width
-        center_y = self.top_left_y + row * square_height
-        size = min(square_width, square_height) * 0.9
 
         self.transparent_piece_color = self.player_turn
 
-        pixmap = (
-            self.white_stone_pixmap
-            if self.transparent_piece_color == 1
-            else self.black_stone_pixmap
-        )
-
-        x = center_x - size / 2
-        y = center_y - size / 2
+        x, y = self.stonePosition(row, col)
 
         painter.setOpacity(0.5)  # Semi-transparent effect
-        painter.drawPixmap(int(x), int(y), int(size), int(size), pixmap)
+        painter.drawPixmap(x, y, self.stone_sprites[self.transparent_piece_color])
         painter.setOpacity(1.0)  # Reset opacity to normal
 
     def handleCapturedPieces(self, captured_positions):
@@ -373,91 +599,66 @@ class Board(QFrame):
         square_height = self.square_side / (self.boardHeight - 1)
 
         # Prepare captured pieces for animation
+        pieces = []
         for row, col in captured_positions:
-            piece = self.boardArray[row][col]
+            piece = self.boardArray[row, col]
             center_x = self.top_left_x + col * square_width
             center_y = self.top_left_y + row * square_height
-            self.captured_pieces.append({"piece": piece, "x": center_x, "y": center_y})
+            pieces.append({"piece": piece, "x": center_x, "y": center_y})
 
-        # Trigger the upward animation
-        self.animateCapturedPiecesUpward()
-
-    def animateCapturedPiecesUpward(self):
-        """Animate captured pieces upward slightly."""
-        for captured in self.captured_pieces:
-            captured["y"] -= 10  # Move upward slightly
-
-        self.update()  # Redraw the board to reflect changes
-
-        # After a short delay, slide pieces out of the board
-        self.capture_timer.start(700)  # 700ms second delay before sliding out
-
-    def slideOutCapturedPieces(self):
-        """Animate all captured pieces sliding out of the board over 0.5 seconds."""
-        self.animation_step = 0
-        total_steps = 200  # Divide the 0.5 seconds into 100 steps (5ms per step)
-
-        def animateStep():
-            """Perform one step of the sliding animation."""
-            for captured in self.captured_pieces:
-                captured["x"] += self.square_side / total_steps  # Gradual movement
-
-            self.update()  # Redraw to reflect changes
-            self.animation_step += 1
-
-            if self.animation_step >= total_steps:
-                self.capture_timer.stop()
-                self.captured_pieces = []  # Clear captured pieces after animation
-
-        # Set up the timer for the animation
-        self.capture_timer = QTimer(self)
-        self.capture_timer.timeout.connect(animateStep)
-        self.capture_timer.start(5)  # Update every 5ms (100 frames for 0.5 seconds)
+        # Lift the pieces, then slide them out of the board
+        self.frame_clock.start(CaptureAnimation(self, pieces))
 
     def drawCapturedPieces(self, painter):
         """Draw captured pieces at their current positions."""
         for captured in self.captured_pieces:
             if self.logic.game_state == 1:
-                pixmap = (
-                    self.white_stone_pixmap
-                    if self.player_turn == 1
-                    else self.black_stone_pixmap
-                )
+                pixmap = self.stone_sprites[1 if self.player_turn == 1 else 2]
             else:
-                pixmap = (
-                    self.white_stone_pixmap
-                    if self.winner == 1
-                    else self.black_stone_pixmap
-                )
-            
-            
+                pixmap = self.stone_sprites[1 if self.winner == 1 else 2]
+
             if pixmap.isNull():
                 continue
 
-            size = min(self.squareWidth(), self.squareHeight()) * 0.9
-            x = captured["x"] - size / 2
-            y = captured["y"] - size / 2
+            x = captured["x"] - self.stone_size / 2
+            y = captured["y"] - self.stone_size / 2
+
+            painter.drawPixmap(int(x), int(y), pixmap)
 
-            painter.drawPixmap(int(x), int(y), int(size), int(size), pixmap)
+    def drawFireworks(self, painter):
+        """Draw every firework particle with the cached particle sprite."""
+        if self.fireworks is None or self.particle_sprite.isNull():
+            return
+
+        sprite = self.particle_sprite
+        for x, y in zip(*self.fireworks.positions()):
+            painter.drawPixmap(x, y, sprite)
 
     def resetGame(self):
+        self.frame_clock.stop()  # Drop the captures and fireworks of the previous game
         self.initBoard()
         self.winner = 0
         self.player_turn = 2  # black start
         self.conssecutive_passing_turn = 0
         self.handicap_piece_player = None
+        self.hover_row = self.hover_col = -1
+        self.hover_intersection = None
         self.scoreBoard.updatePrisoners(0, 0)
         self.scoreBoard.updateTerritory(0, 0)
         self.scoreBoard.updateTurn(self.player_turn)
         self.scoreBoard.button_resign.setVisible(True)
         self.scoreBoard.button_dispute_not_success.setVisible(False)
+        self.replay = None
+        self.scoreBoard.updateReplay(0, 0)
         self.update()
 
     def start(self):
-        self.resetGame()
         self.ask_handicap()
+        self.boardWidth = self.boardHeight = self.handicap["size"]
+        self.resetGame()
         self.logic = GameLogic(self.boardArray, self.handicap)
         self.handicap_piece_player = self.logic.start()
+        self.start_time = time.monotonic()
 
         if self.handicap_piece_player:
             self.player_turn = self.handicap_piece_player
@@ -481,10 +682,78 @@ class Board(QFrame):
             self.timer.start(self.timerSpeed)  # start the timer with the correct speed
             print("start () - timer is started")
 
+        self.stopComputer()
+        self.computer = (
+            computer_search(self.boardWidth, self.logic.komi())
+            if self.computer_player
+            else None
+        )
+
+        # Legal moves of the first turn for the hover
+        self.legal_mask = self.logic.legal_moves(self.player_turn)
+
         print("Game started")
+        self.scheduleComputerMove()
+
+    def saveGame(self, path):
+        """Save the moves, the handicap, the komi and the player names in an SGF file."""
+        game = game_record.save_game(self.logic, self.handicap)
+        game.white, game.black = self.scoreBoard.player_names
+        game.date = date.today().isoformat()
+        if self.winner:
+            game.result = ("W" if self.winner == 1 else "B") + "+"
+
+        sgf.save(game, path)
+        print(f"Game saved in {path}")
+
+    def loadGame(self, path):
+        """Load a game from an SGF file and replay its main line, return an error message or None."""
+        try:
+            game = sgf.load(path)
+        except (OSError, ValueError) as error:
+            return str(error)
+
+        if not 5 <= game.size <= HandicapDialog.max_board_size:
+            return f"Board size {game.size}x{game.size} is not supported"
+
+        # the game is replayed on its own board, the current game is kept when a move is refused
+        try:
+            logic, handicap = game_record.load_game(game, self.handicap["ko"])
+        except ValueError as error:
+            return f"{error} in {path}"
+
+        self.handicap = handicap
+        self.boardWidth = self.boardHeight = game.size
+        self.resetGame()
+        self.boardArray = logic.board
+        self.logic = logic
+        self.start_time = time.monotonic()
+        self.stopComputer()
+        self.computer = (
+            computer_search(self.boardWidth, self.logic.komi())
+            if self.computer_player
+            else None
+        )
+
+        if game.moves:
+            self.player_turn = 3 - game.moves[-1][0]
+        elif game.setup:
+            self.player_turn = 3 - game.setup[-1][0]
+        self.scoreBoard.updatePlayerNames(
+            game.white or "White Player", game.black or "Black Player"
+        )
+
+        if self.gamemode == 1:
+            self.player_1_remaining_time = 120
+            self.player_2_remaining_time = 120
+            self.timer.start(self.timerSpeed)
+
+        self.refreshHistory()
+        print(f"Game loaded from {path}")
+        return None
 
     def drawBoardLines(self, painter):
-        """Draw the Go board lines (9x9 grid for intersections) within the margins."""
+        """Draw the Go board lines (grid of intersections) within the margins."""
         painter.setPen(Qt.GlobalColor.black)
 
         square_width = self.square_side / (self.boardWidth - 1)
@@ -498,48 +767,30 @@ class Board(QFrame):
             y = int(self.top_left_y + row * square_height)
             painter.drawLine(self.top_left_x, y, self.top_left_x + self.square_side, y)
 
-    def drawPieces(self, painter):
-        """Draw pieces centered on intersections within the square board."""
-        square_width = self.square_side / (self.boardWidth - 1)
-        square_height = self.square_side / (self.boardHeight - 1)
+    def drawPieces(self, painter, exposed):
+        """Draw pieces centered on intersections within the square board and the exposed region."""
+        board = self.boardArray if self.replay is None else self.replay.board
 
-        for row in range(len(self.boardArray)):
-            for col in range(len(self.boardArray[0])):
-                piece = self.boardArray[row][col]
-                if piece.state == 1:  # White stone
-                    pixmap = self.white_stone_pixmap
-                elif piece.state == 2:  # Black stone
-                    pixmap = self.black_stone_pixmap
-                else:
+        rows, cols = self.visibleCells(exposed)
+        for row in rows:
+            for col in cols:
+                state = board.state(row, col)
+                if state == 0:
                     continue
 
-                # Calculate the center of the intersection
-                center_x = self.top_left_x + col * square_width
-                center_y = self.top_left_y + row * square_height
-                size = min(square_width, square_height) * 0.9
+                x, y = self.stonePosition(row, col)
+                painter.drawPixmap(x, y, self.stone_sprites[state])
 
-                x = center_x - size / 2
-                y = center_y - size / 2
-                painter.drawPixmap(int(x), int(y), int(size), int(size), pixmap)
         # Draw the pending move, if any
-        if self.pending_moves:
+        if self.pending_moves and self.replay is None:
             row, col = (
                 self.pending_moves[self.current_pending_index]["row"],
                 self.pending_moves[self.current_pending_index]["col"],
             )
-            pixmap = (
-                self.white_stone_pixmap
-                if self.player_turn == 1
-                else self.black_stone_pixmap
-            )
-            center_x = self.top_left_x + col * square_width
-            center_y = self.top_left_y + row * square_height
-            size = min(square_width, square_height) * 0.9
-            x = center_x - size / 2
-            y = center_y - size / 2
+            x, y = self.stonePosition(row, col)
 
             painter.setOpacity(0.8)  # Semi-transparent effect
-            painter.drawPixmap(int(x), int(y), int(size), int(size), pixmap)
+            painter.drawPixmap(x, y, self.stone_sprites[self.player_turn])
             painter.setOpacity(1.0)  # Reset opacity
 
     def triggerHighlight(self):
@@ -571,18 +822,16 @@ class Board(QFrame):
             painter.drawEllipse(int(x), int(y), int(size), int(size))
 
     def drawStars(self, painter):
-        """Draw black dots (stars) at specific intersections on the board."""
-        star_positions = [(3, 3), (7, 3), (5, 5), (3, 7), (7, 7)]
-
+        """Draw black dots (stars) at the hoshi intersections of the board size."""
         square_width = self.square_side / (self.boardWidth - 1)
         square_height = self.square_side / (self.boardHeight - 1)
 
         painter.setBrush(Qt.GlobalColor.black)
         painter.setPen(Qt.GlobalColor.black)
 
-        for row, col in star_positions:
-            x = self.top_left_x + (col - 1) * square_width
-            y = self.top_left_y + (row - 1) * square_height
+        for row, col in self.boardArray.star_points():
+            x = self.top_left_x + col * square_width
+            y = self.top_left_y + row * square_height
             size = (
                 min(square_width, square_height) * 0.1
             )  # Star size as a fraction of square size
@@ -590,6 +839,37 @@ class Board(QFrame):
                 int(x - size / 2), int(y - size / 2), int(size), int(size)
             )
 
+    def drawCoordinates(self, painter):
+        """Draw the column letters above and below the grid and the row numbers on its sides."""
+        square_width = self.square_side / (self.boardWidth - 1)
+        square_height = self.square_side / (self.boardHeight - 1)
+        offset = self.margin // 2
+        box = self.margin
+
+        painter.setPen(Qt.GlobalColor.black)
+
+        for col in range(self.boardWidth):
+            x = int(self.top_left_x + col * square_width) - box // 2
+            letter = self.coordinate_letters[col]
+            for y in (
+                self.top_left_y - offset,
+                self.top_left_y + self.square_side + offset,
+            ):
+                painter.drawText(
+                    x, y - box // 2, box, box, Qt.AlignmentFlag.AlignCenter, letter
+                )
+
+        for row in range(self.boardHeight):
+            y = int(self.top_left_y + row * square_height) - box // 2
+            number = str(self.boardHeight - row)  # row 1 at the bottom
+            for x in (
+                self.top_left_x - offset,
+                self.top_left_x + self.square_side + offset,
+            ):
+                painter.drawText(
+                    x - box // 2, y, box, box, Qt.AlignmentFlag.AlignCenter, number
+                )
+
     def print_player_turn(self):
         color = "white" if self.player_turn == 1 else "black"
         print(f"Player {self.player_turn} ({color}) turn")
@@ -597,19 +877,109 @@ class Board(QFrame):
     def sizeHint(self):
         return QSize(950, 800)
 
+    def undoMove(self):
+        """Take back the last committed move."""
+        if self.logic.game_state() != 1 or self.handicap_piece_player:
+            return
+
+        record = self.logic.undo()
+        if record is None:
+            return
+
+        # Against the computer, take back its answer and the move of the player
+        if record.state == self.computer_player and self.logic.can_undo():
+            record = self.logic.undo()
+
+        self.player_turn = record.state
+        self.refreshHistory()
+
+    def redoMove(self):
+        """Play again the last move taken back."""
+        if self.logic.game_state() != 1 or self.handicap_piece_player:
+            return
+
+        record = self.logic.redo()
+        if record is None:
+            return
+
+        if 3 - record.state == self.computer_player and self.logic.can_redo():
+            record = self.logic.redo()
+
+        self.player_turn = 3 - record.state
+        self.refreshHistory()
+
+    def refreshHistory(self):
+        """Bring the turn, the score board and the hover up to date after an undo or a redo."""
+        self.conssecutive_passing_turn = self.logic.trailing_passes()
+
+        self.scoreBoard.updateTurn(self.player_turn)
+        prisoners_p1, prisoners_p2 = self.logic.count_prisoners()
+        territory_p1, territory_p2 = self.logic.count_territory()
+        self.scoreBoard.updatePrisoners(prisoners_p1, prisoners_p2)
+        self.scoreBoard.updateTerritory(territory_p1, territory_p2)
+
+        self.legal_mask = self.logic.legal_moves(self.player_turn)
+        self.resolveHover(force=True)
+
+        self.pending_moves.clear()
+        self.current_pending_index = -1
+        self.refreshReplay()
+        self.update()
+        self.scheduleComputerMove()
+
+    def seekReplay(self, move_number):
+        """Show the position after the given number of moves, the last move gives back the live board."""
+        moves = self.logic.moves()
+        if move_number >= len(moves):
+            if self.replay is not None:
+                self.replay = None
+                prisoners_p1, prisoners_p2 = self.logic.count_prisoners()
+                self.scoreBoard.updatePrisoners(prisoners_p1, prisoners_p2)
+                self.resolveHover(force=True)
+            self.scoreBoard.updateReplay(len(moves), len(moves))
+            self.update()
+            return
+
+        if self.replay is None:
+            self.replay = GameReplay(self.boardWidth, moves)
+            self.updateCell(self.hover_row, self.hover_col)
+            self.hover_row = self.hover_col = -1
+            self.hover_intersection = None
+
+        self.replay.seek(move_number)
+        self.scoreBoard.updatePrisoners(
+            self.replay.prisoners[1], self.replay.prisoners[2]
+        )
+        self.scoreBoard.updateReplay(move_number, len(moves))
+        self.update()
+
+    def refreshReplay(self):
+        """Go back to the live board once the played moves changed."""
+        self.replay = None
+        total = len(self.logic.moves())
+        self.scoreBoard.updateReplay(total, total)
+
     def update_turn(self, pass_turn=False):
 
         if pass_turn:
+            self.logic.pass_turn(self.player_turn)
             self.conssecutive_passing_turn += 1
         else:
             self.conssecutive_passing_turn = 0  # reset if not passing turn
 
         if self.conssecutive_passing_turn >= 2:
-            self.conssecutive_passing_turn = 0 # reset in all case
+            self.conssecutive_passing_turn = 0  # reset in all case
             if self.logic.game_state() == 1:
                 self.scoreBoard.button_dispute_not_success.setVisible(True)
                 self.scoreBoard.button_resign.setVisible(False)
                 self.logic.end_game()
+
+                message_box = QMessageBox()
+                message_box.setWindowTitle("Ending game mode")
+                message_box.setText(
+                    "Starting the ending game mode, select the dead piece to remove."
+                )
+                message_box.exec()
             elif self.logic.game_state() == 2:
                 self.game_ended()
 
@@ -648,32 +1018,121 @@ class Board(QFrame):
 
         print(f"player turn {self.player_turn}")
 
+        # Legal moves of the new turn for the hover
+        self.legal_mask = self.logic.legal_moves(self.player_turn)
+        self.resolveHover(force=True)
+
         # Clear pending move and update board
         self.pending_moves.clear()
         self.current_pending_index = -1
+        self.refreshReplay()
         self.update()
+        self.scheduleComputerMove()
+
+    def cancelComputerSearch(self):
+        """Drop the running search, the position it was started on is gone."""
+        if self.search_token is not None:
+            self.search_token.cancel()
+            self.search_token = None
+
+    def stopComputer(self):
+        """Cancel the search, wait for it to return and shut the computer down."""
+        self.cancelComputerSearch()
+        self.search_pool.waitForDone()
+        if self.computer:
+            self.computer.close()
+            self.computer = None
+
+    def scheduleComputerMove(self):
+        """Start the search of the computer in the background if it is its turn, the previous search is cancelled."""
+        self.cancelComputerSearch()
+        if not (self.computer and self.logic.game_state() == 1):
+            return
+
+        if self.player_turn == self.computer_player:
+            # once the reused tree holds as many visits as a full search, the computer answers at once
+            thinking_time = self.thinking_time
+            max_visits = int(self.thinking_time * self.computer_rate) or None
+        elif self.pondering and not self.handicap_piece_player:
+            thinking_time = self.thinking_time * MonteCarloTreeSearch.PONDER_FACTOR
+            max_visits = None
+        else:
+            return
+
+        self.search_token = SearchToken()
+        self.search_job = SearchJob(
+            self.search_token,
+            self.computer.search,
+            bytes(self.boardArray.cells),
+            self.player_turn,
+            bytes(self.logic.legal_moves(self.player_turn)),
+            self.logic.trailing_passes(),
+            thinking_time,
+            allow_pass=not self.handicap_piece_player,
+            max_visits=max_visits,
+            ko_point=self.logic.ko_point(),
+        )
+        if self.player_turn == self.computer_player:
+            self.search_job.signals.finished.connect(self.playComputerMove)
+        self.search_pool.start(self.search_job)
+
+    def playComputerMove(self, token, point):
+        """Play the move found by the search, unless the position changed in the meantime."""
+        if token is not self.search_token or token.is_cancelled():
+            return
+        self.search_token = None
+        if not (
+            self.logic.game_state() == 1 and self.player_turn == self.computer_player
+        ):
+            return
+
+        if self.computer.elapsed >= self.thinking_time / 2:
+            # too short searches are not measured
+            self.computer_rate = self.computer.playouts_per_second()
+        print(
+            f"playComputerMove() - {self.computer.playouts} playouts, {self.computer.reused} reused visits,"
+            f" {self.computer.playouts_per_second():.0f} playouts/sec in {self.computer.elapsed:.2f} s"
+        )
+
+        if point is None:
+            self.update_turn(True)
+            return
+
+        row, col = self.boardArray.position(point)
+        captured_positions = self.logic.capturing_territory(
+            Piece(self.player_turn, row, col)
+        )
+        if captured_positions:
+            self.handleCapturedPieces(captured_positions)
+
+        clickLoc = f"({row}, {col})"
+        print("playComputerMove() -  Location :" + clickLoc)
+        self.clickLocationSignal.emit(clickLoc)
+
+        self.update_turn()
 
     def game_ended(self):
         self.logic.stop()
+        self.cancelComputerSearch()
 
         white_score, black_score = self.logic.territory_scoring()
 
         if white_score > black_score:
-            msg = (
-                f"White player win by {white_score - black_score} points.\nWhite points: {white_score}\nBlack points: {black_score}"
-            )
+            msg = f"White player win by {white_score - black_score} points.\nWhite points: {white_score}\nBlack points: {black_score}"
             self.winner = 1
         elif black_score > white_score:
-            msg = (
-                f"Black player win by {black_score - white_score} points.\nWhite points: {white_score}\nBlack points: {black_score}"
-            )
+            msg = f"Black player win by {black_score - white_score} points.\nWhite points: {white_score}\nBlack points: {black_score}"
             self.winner = 2
         else:
             msg = "Equality"
 
+        self.recordGame("score", self.winner, white_score, black_score)
+
         message_box = QMessageBox()
         message_box.setWindowTitle("Game Over")
-        message_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        message_box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         message_box.setText(msg)
 
         # Customize button text
@@ -693,10 +1152,7 @@ class Board(QFrame):
         elif response == QMessageBox.StandardButton.No:
             self.resetGame()
             self.scoreBoard.close()
-            self.returnToMenuSignal.emit()      
-
-
-
+            self.returnToMenuSignal.emit()
 
     def ask_handicap(self):
         """
@@ -712,6 +1168,8 @@ class Board(QFrame):
                 "type": None,
                 "value": None,
                 "komi": "6.5",
+                "ko": "Simple ko",
+                "size": 9,
             }
 
     def resignGame(self):
@@ -720,12 +1178,16 @@ class Board(QFrame):
         opponent = 3 - self.player_turn
         msg = f"Winner is Player {opponent} because Player {self.player_turn} resigned"
         self.logic.stop()
+        self.cancelComputerSearch()
 
         self.winner = opponent
+        self.recordGame("resign", opponent)
 
         message_box = QMessageBox()
         message_box.setWindowTitle("Game Over")
-        message_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        message_box.setStandardButtons(
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         message_box.setText(msg)
 
         # Customize button text
@@ -745,17 +1207,20 @@ class Board(QFrame):
         elif response == QMessageBox.StandardButton.No:
             self.resetGame()
             self.scoreBoard.close()
-            self.returnToMenuSignal.emit()        
-            
+            self.returnToMenuSignal.emit()
 
     def disputeNotSuccessing(self):
         if self.logic.game_state() == 2 or self.logic.game_state() == 3:
             self.logic.stop()
+            self.cancelComputerSearch()
             msg = "Both players lose because the dispute did not resolve."
+            self.recordGame("dispute", 0)
 
             message_box = QMessageBox()
             message_box.setWindowTitle("Game Over")
-            message_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            message_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
             message_box.setText(msg)
 
             # Customize button text
@@ -773,49 +1238,50 @@ class Board(QFrame):
             elif response == QMessageBox.StandardButton.No:
                 self.resetGame()
                 self.scoreBoard.close()
-                self.returnToMenuSignal.emit()        
-
-    def triggerFireworksAnimation(self):
-        firework_particles = []
-
-        # Initialize firework particles
-        for _ in range(50):  # Number of particles
-            x = random.uniform(self.top_left_x, self.top_left_x + self.square_side)
-            y = random.uniform(self.top_left_y, self.top_left_y + self.square_side)
-            vx = random.uniform(-2, 2)  # Random velocity
-            vy = random.uniform(-3, -1)  # Negative for upward motion
-            lifetime = random.uniform(200, 500)  # Lifespan in frames
-
-            firework_particles.append(
-                {   
-                    "x": x,
-                    "y": y,
-                    "vx": vx,
-                    "vy": vy,
-                    "lifetime": lifetime,
+                self.returnToMenuSignal.emit()
+
+    def recordGame(self, result_type, winner, white_score=None, black_score=None):
+        """Store the finished game in the local database, a failure is reported but does not stop the game."""
+        white, black = self.scoreBoard.player_names
+        try:
+            if self.database is None:
+                # Each finished game is written in its own transaction, a crash does not lose it
+                self.database = GameDatabase(batch_size=1)
+            self.database.add_game(
+                {
+                    "date": datetime.now().isoformat(timespec="seconds"),
+                    "white": white,
+                    "black": black,
+                    "size": self.boardWidth,
+                    "handicap_type": self.handicap["type"],
+                    "handicap_player": self.handicap["player"],
+                    "handicap_value": self.handicap["value"],
+                    "komi": float(self.handicap["komi"]),
+                    "ko_rule": self.handicap["ko"],
+                    "result_type": result_type,
+                    "winner": winner,
+                    "white_score": white_score,
+                    "black_score": black_score,
+                    "duration": time.monotonic() - self.start_time,
+                    "final_hash": self.logic.position_hash(),
+                    "moves": self.logic.moves(),
                 }
             )
+        except sqlite3.Error as error:
+            print(f"Failed to record the game: {error}")
 
-        # Animate fireworks
-        def animateFireworks():
-            for particle in firework_particles:
-                particle["x"] += particle["vx"]
-                particle["y"] += particle["vy"]
-                particle["vy"] -= 0.05  # Gravity effect
-                particle["lifetime"] -= 1
-
-            self.update()  # Update the board for each frame
-
-            # Remove dead particles
-            self.captured_pieces = [p for p in firework_particles if p["lifetime"] > 0]
-
-            if not self.captured_pieces:
-                self.fireworks_timer.stop()
+    def closeDatabase(self):
+        """Close the database, called when the application quits."""
+        if self.database is None:
+            return
+        try:
+            self.database.close()
+        except sqlite3.Error as error:
+            print(f"Failed to record the games: {error}")
+        self.database = None
 
-        # Set up a timer for the fireworks animation
-        self.fireworks_timer = QTimer(self)
-        self.fireworks_timer.timeout.connect(animateFireworks)
-        self.fireworks_timer.start(10)
+    def triggerFireworksAnimation(self):
+        self.frame_clock.start(FireworksAnimation(self))
 
     def timerEvent(self):
         """this event is automatically called when the timer is updated. based on the timerSpeed variable"""
@@ -826,13 +1292,17 @@ class Board(QFrame):
                 if self.player_1_remaining_time == 0:
                     print("Game over for player 1")
                     self.logic.stop()
+                    self.cancelComputerSearch()
                     msg = "Black player win by timeout"
-                    
-                    self.winner = 1
+
+                    self.winner = 2
+                    self.recordGame("timeout", self.winner)
 
                     message_box = QMessageBox()
                     message_box.setWindowTitle("Winner")
-                    message_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+                    message_box.setStandardButtons(
+                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                    )
                     message_box.setText(msg)
 
                     # Customize button text
@@ -847,7 +1317,9 @@ class Board(QFrame):
                     response = message_box.exec()
 
                     if response == QMessageBox.StandardButton.Yes:
-                        QMessageBox.information(self, "New Game", "Launching new game process")
+                        QMessageBox.information(
+                            self, "New Game", "Launching new game process"
+                        )
                         self.start()
                     elif response == QMessageBox.StandardButton.No:
                         self.resetGame()
@@ -862,13 +1334,17 @@ class Board(QFrame):
                 if self.player_2_remaining_time == 0:
                     print("Game over for player 2")
                     self.logic.stop()
+                    self.cancelComputerSearch()
                     msg = "White player win by timeout"
-                    
-                    self.winner = 2
+
+                    self.winner = 1
+                    self.recordGame("timeout", self.winner)
 
                     message_box = QMessageBox()
                     message_box.setWindowTitle("Winner")
-                    message_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+                    message_box.setStandardButtons(
+                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+                    )
                     message_box.setText(msg)
 
                     # Customize button text
@@ -883,7 +1359,9 @@ class Board(QFrame):
                     response = message_box.exec()
 
                     if response == QMessageBox.StandardButton.Yes:
-                        QMessageBox.information(self, "New Game", "Launching new game process")
+                        QMessageBox.information(
+                            self, "New Game", "Launching new game process"
+                        )
                         self.start()
                     elif response == QMessageBox.StandardButton.No:
                         self.resetGame()
@@ -895,4 +1373,6 @@ class Board(QFrame):
                 print("timerEvent() for Black player", self.player_2_remaining_time)
 
             # Emit the signal with the remaining time for both players
-            self.updateTimerSignal.emit(self.player_1_remaining_time, self.player_2_remaining_time)
+            self.updateTimerSignal.emit(
+                self.player_1_remaining_time, self.player_2_remaining_time
+            )
@@ -0,0 +1,162 @@
+import sqlite3
+import sgf
+
+RESULT_TYPES = ("score", "resign", "timeout", "dispute")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    white TEXT NOT NULL,
+    black TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    handicap_type TEXT,
+    handicap_player INTEGER NOT NULL DEFAULT 0,
+    handicap_value REAL,
+    komi REAL NOT NULL,
+    ko_rule TEXT NOT NULL,
+    result_type TEXT NOT NULL CHECK (result_type IN ('score', 'resign', 'timeout', 'dispute')),
+    winner INTEGER NOT NULL,
+    white_score REAL,
+    black_score REAL,
+    duration REAL NOT NULL,
+    final_hash INTEGER NOT NULL,
+    moves TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_white ON games (white, date);
+CREATE INDEX IF NOT EXISTS games_black ON games (black, date);
+CREATE INDEX IF NOT EXISTS games_date ON games (date);
+-- the result index without the date of the first databases
+DROP INDEX IF EXISTS games_result;
+CREATE INDEX IF NOT EXISTS games_result_date ON games (result_type, winner, date);
+CREATE INDEX IF NOT EXISTS games_final_hash ON games (final_hash);
+"""
+
+COLUMNS = (
+    "date",
+    "white",
+    "black",
+    "size",
+    "handicap_type",
+    "handicap_player",
+    "handicap_value",
+    "komi",
+    "ko_rule",
+    "result_type",
+    "winner",
+    "white_score",
+    "black_score",
+    "duration",
+    "final_hash",
+    "moves",
+)
+
+
+def signed_hash(position_hash):
+    """
+    SQLite integers are signed 64 bits, the unsigned Zobrist hash is stored with the same bits
+    """
+    return position_hash - (1 << 64) if position_hash >= 1 << 63 else position_hash
+
+
+def format_moves(moves):
+    """
+    Write the moves as SGF nodes, like ";B[pd];W[dp];B[]"
+    """
+    return "".join(
+        f";{'W' if state == 1 else 'B'}[{sgf.format_point(position)}]"
+        for state, position in moves
+    )
+
+
+class GameDatabase(object):
+    """
+    Local SQLite database of the finished games
+    New games are kept in memory and written together in one transaction once the batch is full
+    or when the database is closed, a batch_size of 1 writes each game as soon as it is added
+    The players, the date, the result and the final position are indexed
+    """
+
+    DEFAULT_PATH = "games.sqlite3"
+    BATCH_SIZE = 500  # games written in one transaction
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+        self.__pending = []
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def add_game(self, game):
+        """
+        Queue a finished game given as a dict with the COLUMNS keys, moves as (state, position)
+        and final_hash as the unsigned hash of the final position
+        """
+        if game["result_type"] not in RESULT_TYPES:
+            raise ValueError(f"Unknown result type {game['result_type']}")
+
+        row = dict(game)
+        row["moves"] = format_moves(game["moves"])
+        row["final_hash"] = signed_hash(game["final_hash"])
+        self.__pending.append(tuple(row[column] for column in COLUMNS))
+
+        if len(self.__pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the queued games in a single transaction
+        """
+        if not self.__pending:
+            return
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                self.__pending,
+            )
+        self.__pending = []
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __query(self, where, parameters, limit):
+        self.flush()
+        return self.connection.execute(
+            f"SELECT * FROM games WHERE {where} ORDER BY date DESC, id DESC LIMIT ?",
+            (*parameters, limit),
+        ).fetchall()
+
+    def games_by_player(self, name, limit=100):
+        """
+        Return the last games played by the player with any color, each color uses its own index
+        """
+        self.flush()
+        return self.connection.execute(
+            "SELECT * FROM (SELECT * FROM games WHERE white = ?"
+            " UNION ALL SELECT * FROM games WHERE black = ? AND white != ?)"
+            " ORDER BY date DESC, id DESC LIMIT ?",
+            (name, name, name, limit),
+        ).fetchall()
+
+    def games_between(self, first_date, last_date, limit=100):
+        return self.__query("date BETWEEN ? AND ?", (first_date, last_date), limit)
+
+    def games_with_result(self, result_type, winner=None, limit=100):
+        if winner is None:
+            return self.__query("result_type = ?", (result_type,), limit)
+        return self.__query(
+            "result_type = ? AND winner = ?", (result_type, winner), limit
+        )
+
+    def games_with_position(self, position_hash, limit=100):
+        """
+        Return the games that ended on the position with the given Zobrist hash
+        """
+        return self.__query("final_hash = ?", (signed_hash(position_hash),), limit)
+
+    def count(self):
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM games").fetchone()[0]
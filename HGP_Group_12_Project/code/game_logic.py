@@ -1,11 +1,39 @@
+from typing import NamedTuple
 from piece import Piece
-from copy import deepcopy
-from PyQt6.QtWidgets import QMessageBox
+from goban import Goban
+from group_table import GroupTable, TURN_KEYS
+from territory import TerritoryIndex
+
+
+class MoveRecord(NamedTuple):
+    """
+    Entry of the move journal, everything needed to take a move back or play it again
+    without keeping a copy of the board
+    """
+
+    point: int | None  # goban point of the stone, None for a pass
+    state: int  # player who moved
+    captured: list  # goban points of the captured pieces
+    prisoners: tuple  # prisoners won by (player 1, player 2)
+    hash: int  # hash of the position after the move
+    previous_hash: int | None  # ko state before the move
+    last_captures: list
+    new_position: bool  # the move added its position to the history
+    new_situation: bool
+    handicap: bool  # handicap and setup pieces are not taken back
 
 
 class GameLogic:
+    """
+    Rules engine of the game, pure Python without any Qt dependency
+    The outcomes are given back through the return values, the GUI layer does the prompting
+    """
+
+    KO_RULES = ("Simple ko", "Positional superko", "Situational superko")
 
-    __ko_state = False  # ko state round before, init as false
+    __previous_hash = None  # hash of the position before the last move
+    __last_captures = []  # points captured by the last move
+    __legal_key = None  # (hash, player) of the position the legal mask was computed for
     __prisoners_p1 = 0  # Counter for Player 1's prisoners
     __prisoners_p2 = 0  # Counter for Player 2's prisoners
     __territory_p1 = 0  # Territory count for player 1
@@ -14,18 +42,30 @@ class GameLogic:
     __score_p2 = 0
     __game_state = 0  # not playing
     __final_board = None
+    __final_journal = 0  # moves of the journal when the dispute started
+    __journal_start = 0  # moves before this index can not be taken back
     __handicap_player = None
 
-    def __init__(self, board: list[list[Piece]], handicaps):
+    def __init__(self, board: Goban, handicaps):
         """
         Init of game logic, komi is the point compensation given to white player as it's black who start here 6.5 as we follow japanese rules
         """
         self.board = board  # saving the pointing to the board
-        self.__top = len(board)  # getting the max index + 1
+        self.__top = board.size  # getting the max index + 1
+        self.__groups = GroupTable(board)  # groups and liberties of the pieces
+        self.__territory = TerritoryIndex(board)  # empty regions and their owner
+        self.__positions = {self.__groups.hash}  # hashes of all the past positions
+        # same with the player to move
+        self.__situations = {self.__groups.hash ^ TURN_KEYS[2]}
+        # MoveRecord of every move, the ones after the index can be played again
+        self.__journal = []
+        self.__journal_index = 0  # number of moves of the journal on the board
+        self.handicap_pieces_left = None
         self.__init_handicap(handicaps)
 
     def __init_handicap(self, handicaps):
 
+        self.__ko_rule = handicaps["ko"]
         self.__komi_p1 = float(handicaps["komi"])
         self.__komi_p2 = 0
 
@@ -51,170 +91,143 @@ class GameLogic:
     def game_state(self):
         return self.__game_state
 
-    def check_piece_placement(self, new_piece: Piece, hover=False):
+    def check_piece_placement(self, new_piece: Piece):
         """
         Function that will check a movement's validity
         """
-        is_in_ko = self.ko(new_piece)  # check if the move create a ko or is in a ko
+        return (
+            self.legal_moves(new_piece.state)[self.board.point(*new_piece.position)]
+            == 1
+        )
 
-        # check if move is suicidal
-        if self.suicide(new_piece):
-            return False
+    def legal_moves(self, state):
+        """
+        Return the legal moves mask of the player, indexed by goban point
+        The mask is built once per turn from the playable masks of the group table,
+        which only recomputes the points around the last changes, then the ko rule is applied
+        """
+        key = (self.__groups.hash, state)
+        if key != self.__legal_key:
+            self.__groups.update_playable()
+            mask = bytearray(self.__groups.playable[state])
+
+            # only a capture can give back the position before the last move
+            if self.__ko_rule == "Simple ko":
+                candidates = self.__last_captures
+            else:
+                candidates = self.board.points()
 
-        # check if the last move created a ko and if this move is in the ko
-        if self.__ko_state and is_in_ko:
-            return False
+            for point in candidates:
+                if mask[point] and self.__repeats_position(point, state):
+                    mask[point] = 0
 
-        # if the move is ko or if  last move is ko changing ko state
-        if (is_in_ko or self.__ko_state) and not hover:
-            self.__ko_state = not self.__ko_state
+            self.__legal = mask
+            self.__legal_key = key
 
-        return True
+        return self.__legal
 
-    def ko(self, new_piece: Piece):
+    def position_hash(self):
         """
-        Implementation of the ko rule
-        """
-
-        board_game = deepcopy(self.board)
-        row, col = new_piece.position
-        board_game[row][col] = new_piece
-        deleted_pieces = []
-
-        for dir_row, dir_col in [
-            (-1, 0),
-            (1, 0),
-            (0, -1),
-            (0, 1),
-        ]:
-            new_row, new_col = row + dir_row, col + dir_col
-            if self.existing_position(new_row, new_col):
-                oposite_piece = board_game[new_row][new_col]
-                if oposite_piece.state == 3 - new_piece.state:
-                    res = self.is_encircled(oposite_piece, game_board=board_game)
-                    if res[0] and len(res[1]) == 1:
-                        del_piece = deepcopy(res[1][0])
-                        deleted_pieces.append(del_piece)
-                        del_row, del_col = del_piece.position
-                        board_game[del_row][del_col] = Piece(0, del_row, del_col)
-
-        if len(deleted_pieces) != 1:
-            return False
-        else:
-            piece = deleted_pieces[0]
-            old_row, old_col = piece.position
-            board_game[old_row][old_col] = piece
-            for dir_row, dir_col in [
-                (-1, 0),
-                (1, 0),
-                (0, -1),
-                (0, 1),
-            ]:
-                new_row, new_col = old_row + dir_row, old_col + dir_col
-                if self.existing_position(new_row, new_col):
-                    oposite_piece = board_game[new_row][new_col]
-                    if oposite_piece.state == 3 - piece.state:
-                        res = self.is_encircled(oposite_piece, game_board=board_game)
-                        if res[0] and len(res[1]) == 1:
-                            del_piece = deepcopy(res[1][0])
-                            del_row, del_col = del_piece.position
-                            board_game[del_row][del_col] = Piece(0, del_row, del_col)
-
-            new_board_state = tuple(
-                tuple(piece.state for piece in row) for row in board_game
-            )
-            old_board_state = tuple(
-                tuple(piece.state for piece in row) for row in self.board
-            )
-
-            if new_board_state == old_board_state:
-                # print("KO") # debug
-                return True
-            else:
-                return False
+        Return the Zobrist hash of the current position
+        """
+        return self.__groups.hash
 
-    def suicide(self, new_piece: Piece):
+    def ko_point(self):
         """
-        Check if the movement is suicidal
+        Return the goban point where a single stone was just captured by a single stone in atari,
+        the point the simple ko forbids to the next move, None if there is none
         """
+        if len(self.__last_captures) != 1 or self.__journal_index == 0:
+            return None
+        point = self.__journal[self.__journal_index - 1].point
+        if (
+            point is None
+            or len(self.__groups.group(point)) != 1
+            or len(self.__groups.liberties(point)) != 1
+        ):
+            return None
+        return self.__last_captures[0]
 
-        # check if piece or territory is encircled
-        if self.is_encircled(new_piece)[0]:
-            row, col = new_piece.position
-
-            game_board = deepcopy(self.board)  # do not work coz copy pointer ?
-            game_board[row][col] = new_piece
-
-            # if encircled place hypothetically the piece to check if it encircled at least one opposite piece that encircle it now
-            for dir_row, dir_col in [
-                (-1, 0),
-                (1, 0),
-                (0, -1),
-                (0, 1),
-            ]:
-                new_row, new_col = row + dir_row, col + dir_col
-                if self.existing_position(new_row, new_col):
-                    oposite_piece = self.board[new_row][new_col]
-                    if oposite_piece.state == 3 - new_piece.state:
-                        if self.is_encircled(oposite_piece, game_board=game_board)[0]:
-                            return False
-
-            # if not encircling at least one piece with the new piece then suicidal move
-            return True
-
-        else:
-            return False
+    def komi(self):
+        """
+        Return the komi of (player 1, player 2), the points handicap included
+        """
+        return self.__komi_p1, self.__komi_p2
 
-    def is_encircled(self, piece: Piece, visited=None, visit=None, game_board=None):
+    def make_move(self, row, col, state):
         """
-        Say if a piece or a group of piece is encircled, may return the encircled pieces to delete them
+        Place a piece on the board and remove the pieces it captures,
+        return the undo record (row, col, state, captured positions) for unmake_move
         """
+        captured_points = self.__groups.add_stone(self.board.point(row, col), state)
+        captured_positions = [self.board.position(point) for point in captured_points]
+        return row, col, state, captured_positions
 
-        oposite_state = 3 - piece.state
-        state = piece.state
+    def unmake_move(self, undo):
+        """
+        Revert a move applied by make_move
+        """
+        row, col, state, captured_positions = undo
+        self.__groups.remove_stone(self.board.point(row, col))
 
-        if visited == None:
-            visited = set()
+        for captured_row, captured_col in captured_positions:
+            self.__groups.add_stone(
+                self.board.point(captured_row, captured_col), 3 - state
+            )
 
-        if visit == None:
-            visit = set()
+    def ko(self, new_piece: Piece):
+        """
+        Implementation of the ko rule, say if the move would repeat a position forbidden by the selected rule:
+        Simple ko forbid to go back to the position before the last move,
+        Positional superko forbid any past position,
+        Situational superko forbid any past position with the same player to move
+        """
+        return self.__repeats_position(
+            self.board.point(*new_piece.position), new_piece.state
+        )
 
-        if piece in visited:
-            raise ValueError(f"{piece} cannot be in visited")
+    def __repeats_position(self, point, state):
+        new_hash = self.__groups.hash_after(point, state)
 
-        if game_board == None:
-            game_board = deepcopy(self.board)  # do not work coz copy pointer ?
+        if self.__ko_rule == "Positional superko":
+            return new_hash in self.__positions
+        elif self.__ko_rule == "Situational superko":
+            return new_hash ^ TURN_KEYS[3 - state] in self.__situations
+        else:
+            return new_hash == self.__previous_hash
 
-        visited.add(piece)
+    def suicide(self, new_piece: Piece):
+        """
+        Check if the movement is suicidal
+        """
+        point = self.board.point(*new_piece.position)
+        return self.__groups.is_suicide(point, new_piece.state)
 
-        row, col = piece.position
-        encircled = 0
-        same_color = 0
-        for dir_row, dir_col in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_row, new_col = row + dir_row, col + dir_col
-            if self.existing_position(new_row, new_col):
-                neighbor_piece = game_board[new_row][new_col]
-                if neighbor_piece.state == 0:
-                    return False, [p for p in visited]
-                elif neighbor_piece.state == oposite_state:
-                    encircled += 1
-                elif neighbor_piece.state == state:
-                    if neighbor_piece in visit or neighbor_piece in visited:
-                        continue
-                    else:
-                        visit.add(neighbor_piece)
-            else:
-                encircled += 1
+    def is_encircled(self, piece: Piece):
+        """
+        Say if a piece or a group of piece is encircled, may return the encircled pieces to delete them
+        """
+        point = self.board.point(*piece.position)
 
-        if encircled == 4:
-            return True, [p for p in visited]
+        if self.board.cells[point] == piece.state:
+            group = self.__groups.group(point)
+            encircled = not self.__groups.liberties(point)
         else:
-            if not visit == set():
-                neighbor_piece = visit.pop()
-                game_board[row][col] = piece
-                return self.is_encircled(neighbor_piece, visited, visit, game_board)
-            else:
-                return True, [p for p in visited]
+            # piece not on the board yet, merge hypothetically with the friendly groups around
+            group = [point]
+            liberties = set()
+            for neighbor in self.__groups.neighbors(point):
+                if self.board.cells[neighbor] == 0:
+                    liberties.add(neighbor)
+                elif self.board.cells[neighbor] == piece.state:
+                    neighbor_group = self.__groups.group(neighbor)
+                    if neighbor_group[0] not in group:
+                        group.extend(neighbor_group)
+                        liberties |= self.__groups.liberties(neighbor)
+            liberties.discard(point)
+            encircled = not liberties
+
+        return encircled, [self.board[self.board.position(point)] for point in group]
 
     def existing_position(self, row, col):
         """
@@ -225,94 +238,188 @@ class GameLogic:
         else:
             return False
 
-    def capturing_territory(self, new_piece: Piece):
+    def capturing_territory(self, new_piece: Piece, setup=False):
+        """
+        Place the new piece and capture the pieces it encircles, the move is written in the journal
+        The setup pieces of a loaded game are recorded like the handicap pieces
+        """
+        record = self.__play(
+            self.board.point(*new_piece.position), new_piece.state, setup
+        )
+        self.__record(record)
+
+        return [self.board.position(point) for point in record.captured]
+
+    def pass_turn(self, state):
         """
-        Capture pieces encircled implementation
+        Write the pass of the player in the journal, the board does not change
         """
+        self.__record(
+            MoveRecord(
+                None,
+                state,
+                [],
+                (0, 0),
+                self.__groups.hash,
+                self.__previous_hash,
+                self.__last_captures,
+                False,
+                False,
+                False,
+            )
+        )
 
-        captured_positions = []
+    def __play(self, point, state, setup=False):
+        """
+        Put the stone, update the ko history and the prisoners, return the record of the move
+        """
+        previous_hash, last_captures = self.__previous_hash, self.__last_captures
+        old_hash = self.__groups.hash
+        captured = self.__groups.add_stone(point, state)
+        new_hash = self.__groups.hash
+
+        # remember the new position for the ko rule
+        self.__previous_hash = old_hash
+        self.__last_captures = captured
+        self.__legal_key = None
+        new_position = new_hash not in self.__positions
+        self.__positions.add(new_hash)
+        situation = new_hash ^ TURN_KEYS[3 - state]
+        new_situation = situation not in self.__situations
+        self.__situations.add(situation)
+
+        prisoners = (0, 0)
+        if self.__count_prisoner:
+            if state == 2:
+                prisoners = (0, len(captured))
+            elif state == 1:
+                prisoners = (len(captured), 0)
+        self.__prisoners_p1 += prisoners[0]
+        self.__prisoners_p2 += prisoners[1]
+
+        return MoveRecord(
+            point,
+            state,
+            captured,
+            prisoners,
+            new_hash,
+            previous_hash,
+            last_captures,
+            new_position,
+            new_situation,
+            setup or self.handicap_pieces_left is not None,
+        )
 
-        row, col = new_piece.position
+    def __record(self, record):
+        """
+        Append a new move to the journal, the moves that were taken back are forgotten
+        """
+        del self.__journal[self.__journal_index :]
+        self.__journal.append(record)
+        self.__journal_index += 1
+
+    def can_undo(self):
+        return (
+            self.__journal_index > self.__journal_start
+            and not self.__journal[self.__journal_index - 1].handicap
+        )
+
+    def can_redo(self):
+        return self.__journal_index < len(self.__journal)
+
+    def undo(self):
+        """
+        Take back the last move by applying its reverse delta, return its record or None
+        Only the stone, its group and the captured pieces are touched
+        """
+        if not self.can_undo():
+            return None
 
-        for dir_row, dir_col in [
-            (-1, 0),
-            (1, 0),
-            (0, -1),
-            (0, 1),
-        ]:
-            new_row, new_col = row + dir_row, col + dir_col
-            if self.existing_position(new_row, new_col):
-                oposite_piece = deepcopy(self.board[new_row][new_col])
-                if oposite_piece.state == 3 - new_piece.state:
-                    res = self.is_encircled(oposite_piece)
-                    if res[0]:
-                        for captured_piece in res[1]:
-                            captured_row, captured_col = captured_piece.position
-                            captured_positions.append((captured_row, captured_col))
+        self.__journal_index -= 1
+        record = self.__journal[self.__journal_index]
 
-                            if captured_piece.state == 1 and self.__count_prisoner:
-                                self.__prisoners_p2 += 1
-                            elif captured_piece.state == 2 and self.__count_prisoner:
-                                self.__prisoners_p1 += 1
+        if record.point is not None:
+            self.__groups.remove_stone(record.point)
+            for point in record.captured:
+                self.__groups.add_stone(point, 3 - record.state)
+
+            if record.new_position:
+                self.__positions.discard(record.hash)
+            if record.new_situation:
+                self.__situations.discard(record.hash ^ TURN_KEYS[3 - record.state])
+
+        self.__prisoners_p1 -= record.prisoners[0]
+        self.__prisoners_p2 -= record.prisoners[1]
+        self.__previous_hash = record.previous_hash
+        self.__last_captures = record.last_captures
+        self.__legal_key = None
+
+        return record
+
+    def redo(self):
+        """
+        Play again the last move taken back, return its record or None
+        """
+        if not self.can_redo():
+            return None
+
+        record = self.__journal[self.__journal_index]
+        if record.point is not None:
+            record = self.__play(record.point, record.state, record.handicap)
+            self.__journal[self.__journal_index] = record
+        self.__journal_index += 1
+
+        return record
+
+    def moves(self):
+        """
+        Return the moves on the board as (state, (row, col)), the position is None for a pass
+        """
+        return [
+            (
+                record.state,
+                None if record.point is None else self.board.position(record.point),
+            )
+            for record in self.__journal[: self.__journal_index]
+        ]
 
-                            self.board[captured_row][captured_col].change_state(0)
+    def handicap_moves(self):
+        """
+        Return the handicap pieces as (state, (row, col)), they come first in the moves
+        """
+        return [
+            (record.state, self.board.position(record.point))
+            for record in self.__journal[: self.__journal_index]
+            if record.handicap
+        ]
 
-        return captured_positions
+    def trailing_passes(self):
+        """
+        Return the number of passes in a row at the end of the moves on the board
+        """
+        passes = 0
+        for record in reversed(self.__journal[: self.__journal_index]):
+            if record.point is not None:
+                break
+            passes += 1
+        return passes
 
     def count_prisoners(self):
         """Count the number of prisoners for each player"""
         return self.__prisoners_p1, self.__prisoners_p2
 
     def count_territory(self):
-        """Count the territory for each player"""
-        territory_p1 = 0
-        territory_p2 = 0
-        visited = set()
+        """Count the territory for each player, only the regions changed since the last count are updated"""
+        self.__territory.update(self.__groups.take_changed())
 
-        if (
-            sum([sum([p.state for p in row]) for row in self.board]) < 3
-            and self.__game_state == 1
-        ):
+        stones = self.__groups.stones_count
+        if stones[1] + 2 * stones[2] < 3 and self.__game_state == 1:
             return 0, 0
 
-        for row in range(self.__top):
-            for col in range(self.__top):
-                piece = deepcopy(self.board[row][col])
-                if piece.state == 0 and (row, col) not in visited:
-                    territory, owner = self.flood_fill_territory(row, col, visited)
-                    if owner == 1:
-                        territory_p1 += territory
-                    elif owner == 2:
-                        territory_p2 += territory
-
-        self.__territory_p1 = territory_p1
-        self.__territory_p2 = territory_p2
-
-        return territory_p1, territory_p2
-
-    def flood_fill_territory(self, row, col, visited):
-        """Flood fill algorithm to count territory"""
-        territory = 0
-        owner = None
-        stack = [(row, col)]
-        while stack:
-            r, c = stack.pop()
-            if (r, c) in visited:
-                continue
-            visited.add((r, c))
-            territory += 1
-            for dir_row, dir_col in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                new_row, new_col = r + dir_row, c + dir_col
-                if self.existing_position(new_row, new_col):
-                    neighbor_piece = self.board[new_row][new_col]
-                    if neighbor_piece.state == 0:
-                        stack.append((new_row, new_col))
-                    elif neighbor_piece.state != 0 and owner is None:
-                        owner = neighbor_piece.state
-                    elif neighbor_piece.state != 0 and owner != neighbor_piece.state:
-                        owner = 0  # Mixed territory
-
-        return territory, owner
+        self.__territory_p1 = self.__territory.territory[1]
+        self.__territory_p2 = self.__territory.territory[2]
+
+        return self.__territory_p1, self.__territory_p2
 
     def territory_scoring(self):
         """
@@ -332,12 +439,8 @@ class GameLogic:
         self.__score_p1 = self.__territory_p1 + self.__komi_p1
         self.__score_p2 = self.__territory_p2 + self.__komi_p2
 
-        for row in self.board:
-            for piece in row:
-                if piece.state == 1:
-                    self.__score_p1 += 1
-                elif piece.state == 2:
-                    self.__score_p2 += 1
+        self.__score_p1 += self.__groups.stones_count[1]
+        self.__score_p2 += self.__groups.stones_count[2]
 
         return self.__score_p1, self.__score_p2
 
@@ -349,91 +452,45 @@ class GameLogic:
         self.__count_prisoner = True
 
         if self.__final_board:
-            for row in range(self.__top):
-                for col in range(self.__top):
-                    final_state = self.__final_board[row][col].state
-                    actual_piece = self.board[row][col]
-                    if actual_piece.state != final_state:
-                        actual_piece.change_state(final_state)
-
-        message_box = QMessageBox()
-        message_box.setWindowTitle("Ending game mode")
-        message_box.setText(
-            "Starting the ending game mode, select the dead piece to remove."
-        )
-        message_box.exec()
+            self.board.cells[:] = self.__final_board.cells
+            del self.__journal[
+                self.__final_journal :
+            ]  # the dispute moves are forgotten
+            self.__groups.rebuild()
+
+        # the moves before the end of the game can not be taken back any more
+        self.__journal_index = len(self.__journal)
+        self.__journal_start = self.__journal_index
 
-    def remove_dead_pieces_box(
-        self, player_turn, selected_pieces: list[tuple[int, int]]
-    ):
+    def remove_dead_pieces(self, player_turn, selected_pieces: list[tuple[int, int]]):
         """
-        Function to remove dead pieces
+        Function to remove dead pieces once the opponent conceded them, return the removed positions
         """
-
-        selected_piece = Piece(3 - player_turn)
-
-        msg_txt = f"{selected_piece.name} player, do you concede that the selected pieces are dead?"  # maybe permit the name of the player if ther is one
-
-        message_box = QMessageBox()
-        message_box.setWindowTitle("Concede Pieces")
-        message_box.setText(msg_txt)
-        message_box.setStandardButtons(
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        removed_points = self.__groups.remove_group(
+            self.board.point(*selected_pieces[0])
         )
-        response = message_box.exec()
-
-        if response == QMessageBox.StandardButton.Yes:
-            for captured_row, captured_col in selected_pieces:
 
-                if player_turn == 1:
-                    self.__prisoners_p1 += 1
-                elif player_turn == 2:
-                    self.__prisoners_p2 += 1
+        if player_turn == 1:
+            self.__prisoners_p1 += len(removed_points)
+        elif player_turn == 2:
+            self.__prisoners_p2 += len(removed_points)
 
-                self.board[captured_row][captured_col].change_state(0)
+        return selected_pieces
 
-            return selected_pieces
-
-        elif response == QMessageBox.StandardButton.No:
-            return
-
-    def select_neighboor_piece(self, piece: Piece, visited_positions=None, visit=None):
+    def select_neighboor_piece(self, piece: Piece):
         """
         Return a list of all the neighboor piece of the same state
         """
-
-        if visited_positions == None:
-            visited_positions = set()
-
-        if visit == None:
-            visit = set()
-
-        visited_positions.add(piece.position)
-
-        row, col = piece.position
-
-        for dir_row, dir_col in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            new_row, new_col = row + dir_row, col + dir_col
-            if self.existing_position(new_row, new_col):
-                neighbor_piece = deepcopy(self.board[new_row][new_col])
-                if (
-                    neighbor_piece.state == piece.state
-                    and neighbor_piece.position not in visited_positions
-                ):
-                    visit.add(neighbor_piece)
-
-        if len(visit) > 0:
-            neighbor_piece = visit.pop()
-            return self.select_neighboor_piece(neighbor_piece, visited_positions, visit)
-
-        return [pos for pos in visited_positions]
+        return [
+            self.board.position(point)
+            for point in self.__groups.group(self.board.point(*piece.position))
+        ]
 
     def dead_pieces_debate(self):
+        """
+        Go back to playing to settle the dispute, the board is restored when the game ends again
+        """
         self.__game_state = 1
-        self.__final_board = deepcopy(self.board)
+        self.__final_board = self.board.copy()
+        self.__final_journal = self.__journal_index
         self.__count_prisoner = False
-
-        message_box = QMessageBox()
-        message_box.setWindowTitle("Dispute mode")
-        message_box.setText("Starting the dispute mode.")
-        message_box.exec()
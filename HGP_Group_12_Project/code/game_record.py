@@ -0,0 +1,59 @@
+import sgf
+from piece import Piece
+from goban import Goban
+from game_logic import GameLogic
+
+
+def load_game(game, ko_rule):
+    """
+    Replay the main line of an SGF game through the rules engine, return the logic and the
+    handicap settings of the game, a ValueError is raised on a move the rules refuse
+    """
+    handicap = {
+        "player": 2 if game.handicap else 0,
+        "type": "Pieces" if game.handicap else None,
+        "value": game.handicap or None,
+        "komi": str(game.komi),
+        "ko": ko_rule,
+        "size": game.size,
+    }
+
+    # the handicap pieces are among the setup stones, the engine must not wait for them
+    logic = GameLogic(Goban(game.size), dict(handicap, type=None))
+    logic.start()
+
+    for number, (state, position) in enumerate(game.setup + game.moves):
+        setup = number < len(game.setup)
+        if position is None:
+            logic.pass_turn(state)
+        elif not logic.existing_position(*position):
+            raise ValueError(
+                f"Move {sgf.format_point(position)} is off the {game.size}x{game.size} board"
+            )
+        elif logic.check_piece_placement(Piece(state, *position)):
+            logic.capturing_territory(Piece(state, *position), setup)
+        else:
+            raise ValueError(f"Illegal move {sgf.format_point(position)}")
+
+    return logic, handicap
+
+
+def save_game(logic, handicap):
+    """
+    Return the SGF game of the moves on the board, with its komi and handicap
+    """
+    game = sgf.SgfGame(logic.board.size)
+
+    game.komi = float(handicap["komi"])
+    if handicap["type"] == "Points" and handicap["player"] == 1:
+        game.komi += float(handicap["value"])
+    elif handicap["type"] == "Points" and handicap["player"] == 2:
+        game.komi -= float(handicap["value"])
+    elif handicap["type"] == "Pieces":
+        game.handicap = int(handicap["value"])
+
+    # the handicap pieces are written as setup stones, before the first move
+    game.setup = logic.handicap_moves()
+    game.moves = logic.moves()[len(game.setup) :]
+
+    return game
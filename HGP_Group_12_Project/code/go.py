@@ -35,17 +35,12 @@ class Go(QMainWindow):
         self.stackedWidget.addWidget(self.board)
 
         self.startPage.newGameSignal.connect(self.showPlayerNamesPage)
+        self.startPage.newComputerGameSignal.connect(self.startComputerGame)
         self.playerNamesPage.startGameSignal.connect(self.startGame)
 
-        self.board.returnToMenuSignal.connect(
-            self.showStartPage
-        )
-        self.board.resetGameSignal.connect(
-            self.resetGame
-        )
-        self.scoreBoard.resignSignal.connect(
-            self.confirmResign
-        )
+        self.board.returnToMenuSignal.connect(self.showStartPage)
+        self.board.resetGameSignal.connect(self.resetGame)
+        self.scoreBoard.resignSignal.connect(self.confirmResign)
         self.scoreBoard.disputeNotSuccessingSignal.connect(
             self.confirmDisputeNotSuccessful
         )
@@ -79,6 +74,14 @@ class Go(QMainWindow):
         self.adjustSize()
         self.center()
         self.board.gamemode = gamemode
+        self.board.computer_player = None
+
+    def startComputerGame(self, gamemode, thinking_time):
+        """The computer plays White, the player starts with Black."""
+        self.board.gamemode = gamemode
+        self.board.computer_player = 1
+        self.board.thinking_time = thinking_time
+        self.startGame("Computer", "Black Player")
 
     def startGame(self, player1=None, player2=None):
         if player1 and player2:
@@ -110,6 +113,11 @@ class Go(QMainWindow):
         self.center()
 
     def pass_turn(self):
+        if (
+            self.board.logic.game_state() == 1
+            and self.board.player_turn == self.board.computer_player
+        ):
+            return  # The computer is thinking, it passes by itself
         self.board.update_turn(True)
 
     def resetGame(self):
@@ -147,6 +155,12 @@ class Go(QMainWindow):
     def disputeNotSuccessing(self):
         self.board.disputeNotSuccessing()
 
+    def closeEvent(self, event):
+        """Stop the computer and write the recorded games before the application quits"""
+        self.board.stopComputer()
+        self.board.closeDatabase()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         """Adjust the size of the window based on the current page"""
         current_widget = self.stackedWidget.currentWidget()
@@ -0,0 +1,84 @@
+from piece import Piece
+
+BORDER = 3  # state of the points around the board
+
+
+class Goban(object):
+    """
+    Flat board of the pieces states stored in a bytearray, one byte per point
+    The board is padded with a border of BORDER points so that the four neighbors
+    of a point always exist and never need a bounds check
+    The point of (row, col) is (row + 1) * stride + col + 1
+    """
+
+    def __init__(self, size: int, cells: bytearray | None = None):
+        self.size = size
+        self.stride = size + 2
+
+        if cells is None:
+            cells = bytearray([BORDER]) * (self.stride * self.stride)
+            for row in range(size):
+                start = self.point(row, 0)
+                cells[start : start + size] = bytes(size)
+        self.cells = cells
+
+    def point(self, row, col):
+        return (row + 1) * self.stride + col + 1
+
+    def position(self, point):
+        row, col = divmod(point, self.stride)
+        return row - 1, col - 1
+
+    def points(self):
+        """
+        Return all the points of the board, border excluded
+        """
+        return [
+            self.point(row, col) for row in range(self.size) for col in range(self.size)
+        ]
+
+    def neighbors(self, point):
+        return (point - self.stride, point + self.stride, point - 1, point + 1)
+
+    def state(self, row, col):
+        return self.cells[self.point(row, col)]
+
+    def __getitem__(self, position):
+        """
+        Return the piece at the given (row, col) position
+        """
+        row, col = position
+        return Piece(self.cells[self.point(row, col)], row, col)
+
+    def rows(self):
+        """
+        Return the states of the board row by row
+        """
+        return [
+            self.cells[self.point(row, 0) : self.point(row, 0) + self.size]
+            for row in range(self.size)
+        ]
+
+    def star_points(self):
+        """
+        Return the (row, col) positions of the hoshi, 3rd line on small boards and 4th line from 12x12,
+        with the center on odd boards and the side stars on odd boards from 15x15
+        """
+        if self.size < 7:
+            return []
+
+        edge = 2 if self.size < 12 else 3
+        lines = [edge, self.size - 1 - edge]
+        center = self.size // 2
+        points = [(row, col) for row in lines for col in lines]
+
+        if self.size % 2:
+            points.append((center, center))
+            if self.size >= 15:
+                for line in lines:
+                    points += [(line, center), (center, line)]
+
+        return points
+
+    def copy(self):
+        return Goban(self.size, bytearray(self.cells))
@@ -0,0 +1,283 @@
+import random
+from goban import Goban, BORDER
+
+ZOBRIST_SEED = 0x5EED  # fixed seed so the same position always has the same hash
+_zobrist_keys = {}
+
+# keys of the player to move, for the situational superko
+_turn_generator = random.Random(ZOBRIST_SEED)
+TURN_KEYS = (0,) + tuple(_turn_generator.getrandbits(64) for _ in range(2))
+
+
+def zobrist_keys(size: int):
+    """
+    Return the 64 bits random keys of the padded board, indexed by point * 3 + state
+    """
+    if size not in _zobrist_keys:
+        generator = random.Random(ZOBRIST_SEED + size)
+        _zobrist_keys[size] = [
+            generator.getrandbits(64) if index % 3 else 0
+            for index in range((size + 2) * (size + 2) * 3)
+        ]
+    return _zobrist_keys[size]
+
+
+class GroupTable(object):
+    """
+    Union-find table of the groups of pieces on the goban
+    Every group is identified by its root point and keeps its stones and its liberties
+    so that captures, suicide and group lookups do not need to walk the board again
+    The Zobrist hash of the position is updated with every stone added or removed
+    The playable masks say for each point if a stone of a color can be put there without
+    being suicide, only the points around the groups that changed are recomputed
+    The table is the only writer of the goban cells once created
+    """
+
+    def __init__(self, goban: Goban):
+        self.goban = goban
+        self.colors = goban.cells  # state of each point, same values as Piece
+        self.hash = 0  # Zobrist hash of the position, 0 for the empty board
+        self.__keys = zobrist_keys(goban.size)
+        self.__parent = list(range(len(goban.cells)))
+        self.__stones = {}  # root point -> list of the points of the group
+        self.__liberties = {}  # root point -> set of the empty points around the group
+        self.__neighbors = [goban.neighbors(point) for point in range(len(goban.cells))]
+        self.playable = (None, bytearray(len(goban.cells)), bytearray(len(goban.cells)))
+        self.__dirty = set()  # points whose playable state may have changed
+        self.__changed = set()  # points whose state changed, for the territory
+        self.stones_count = [0, 0, 0]  # number of stones of each state on the board
+        self.rebuild()
+
+    def copy(self):
+        """
+        Return an independent table of a copy of the goban, without walking the board again
+        """
+        table = GroupTable.__new__(GroupTable)
+        table.goban = Goban(self.goban.size, bytearray(self.colors))
+        table.colors = table.goban.cells
+        table.hash = self.hash
+        table.__keys = self.__keys
+        table.__parent = self.__parent[:]
+        table.__stones = {root: stones[:] for root, stones in self.__stones.items()}
+        table.__liberties = {
+            root: set(liberties) for root, liberties in self.__liberties.items()
+        }
+        table.__neighbors = self.__neighbors  # never modified
+        table.playable = (
+            None,
+            bytearray(self.playable[1]),
+            bytearray(self.playable[2]),
+        )
+        table.__dirty = set(self.__dirty)
+        table.__changed = set(self.__changed)
+        table.stones_count = self.stones_count[:]
+        return table
+
+    def point(self, row, col):
+        return self.goban.point(row, col)
+
+    def position(self, point):
+        return self.goban.position(point)
+
+    def neighbors(self, point):
+        return self.__neighbors[point]
+
+    def find(self, point):
+        """
+        Return the root point of the group of the given stone
+        """
+        parent = self.__parent
+        while parent[point] != point:
+            parent[point] = parent[parent[point]]  # path halving
+            point = parent[point]
+        return point
+
+    def group(self, point):
+        """
+        Return the points of the group of the given stone
+        """
+        return self.__stones[self.find(point)]
+
+    def liberties(self, point):
+        """
+        Return the liberties of the group of the given stone
+        """
+        return self.__liberties[self.find(point)]
+
+    def add_stone(self, point, color):
+        """
+        Put a stone on an empty point, merge it with its friendly neighbors
+        and remove the opposite groups left without liberties, return the captured points
+        """
+        colors = self.colors
+        colors[point] = color
+        self.hash ^= self.__keys[point * 3 + color]
+        self.stones_count[color] += 1
+        self.__changed.add(point)
+        self.__parent[point] = point
+        self.__stones[point] = [point]
+        liberties = self.__liberties[point] = set()
+        root = point
+
+        for neighbor in self.__neighbors[point]:
+            neighbor_color = colors[neighbor]
+            if neighbor_color == 0:
+                liberties.add(neighbor)
+            elif neighbor_color != BORDER:
+                self.__liberties[self.find(neighbor)].discard(point)
+
+        for neighbor in self.__neighbors[point]:
+            if colors[neighbor] == color:
+                root = self.__union(root, self.find(neighbor))
+
+        self.__dirty.add(point)
+        self.__dirty.update(self.__liberties[root])
+
+        captured = []
+        for neighbor in self.__neighbors[point]:
+            if colors[neighbor] == 3 - color:
+                neighbor_root = self.find(neighbor)
+                if not self.__liberties[neighbor_root]:
+                    captured.extend(self.remove_group(neighbor_root))
+                else:
+                    self.__dirty.update(self.__liberties[neighbor_root])
+
+        return captured
+
+    def remove_group(self, point):
+        """
+        Remove the whole group of the given stone and give its points back as liberties
+        to the groups around, return the removed points
+        """
+        root = self.find(point)
+        stones = self.__stones.pop(root)
+        # empty points losing a neighbor
+        self.__dirty.update(self.__liberties.pop(root))
+        colors = self.colors
+
+        self.stones_count[colors[root]] -= len(stones)
+        self.__changed.update(stones)
+
+        for stone in stones:
+            self.hash ^= self.__keys[stone * 3 + colors[stone]]
+            colors[stone] = 0
+            self.__parent[stone] = stone
+
+        roots = set()
+        for stone in stones:
+            for neighbor in self.__neighbors[stone]:
+                if 0 < colors[neighbor] < BORDER:
+                    neighbor_root = self.find(neighbor)
+                    self.__liberties[neighbor_root].add(stone)
+                    roots.add(neighbor_root)
+
+        self.__dirty.update(stones)
+        for neighbor_root in roots:
+            self.__dirty.update(self.__liberties[neighbor_root])
+
+        return stones
+
+    def remove_stone(self, point):
+        """
+        Remove a single stone, its group is split by putting back the other stones of the group
+        """
+        color = self.colors[point]
+        stones = [stone for stone in self.remove_group(point) if stone != point]
+        for stone in stones:
+            self.add_stone(stone, color)
+
+    def __union(self, root_a, root_b):
+        """
+        Merge two groups by size and return the new root
+        """
+        if root_a == root_b:
+            return root_a
+        if len(self.__stones[root_a]) < len(self.__stones[root_b]):
+            root_a, root_b = root_b, root_a
+        self.__parent[root_b] = root_a
+        self.__stones[root_a].extend(self.__stones.pop(root_b))
+        self.__liberties[root_a] |= self.__liberties.pop(root_b)
+        return root_a
+
+    def captured_by(self, point, color):
+        """
+        Return the points that a stone of the given color on the given point would capture
+        """
+        captured = []
+        roots = set()
+        for neighbor in self.__neighbors[point]:
+            if self.colors[neighbor] == 3 - color:
+                root = self.find(neighbor)
+                if root not in roots and self.__liberties[root] == {point}:
+                    roots.add(root)
+                    captured.extend(self.__stones[root])
+        return captured
+
+    def hash_after(self, point, color):
+        """
+        Return the hash of the position after a stone of the given color is played on the given point
+        """
+        new_hash = self.hash ^ self.__keys[point * 3 + color]
+        for captured in self.captured_by(point, color):
+            new_hash ^= self.__keys[captured * 3 + 3 - color]
+        return new_hash
+
+    def is_suicide(self, point, color):
+        """
+        Say if a stone of the given color on the given point would be left without liberties
+        """
+        for neighbor in self.__neighbors[point]:
+            neighbor_color = self.colors[neighbor]
+            if neighbor_color == 0:
+                return False
+            if neighbor_color == BORDER:
+                continue
+            liberties = self.__liberties[self.find(neighbor)]
+            if neighbor_color == color and len(liberties) > 1:
+                return False  # the friendly group keeps another liberty
+            if neighbor_color == 3 - color and len(liberties) == 1:
+                return False  # the opposite group is captured
+        return True
+
+    def update_playable(self):
+        """
+        Recompute the playable masks on the points touched since the last update
+        """
+        colors = self.colors
+        white, black = self.playable[1], self.playable[2]
+        for point in self.__dirty:
+            if colors[point] == 0:
+                white[point] = not self.is_suicide(point, 1)
+                black[point] = not self.is_suicide(point, 2)
+            else:
+                white[point] = black[point] = 0
+        self.__dirty.clear()
+
+    def take_changed(self):
+        """
+        Return the points whose state changed since the last call
+        """
+        changed, self.__changed = self.__changed, set()
+        return changed
+
+    def rebuild(self):
+        """
+        Rebuild the table from the stones written on the goban
+        """
+        stones = [
+            (point, self.colors[point])
+            for point in self.goban.points()
+            if self.colors[point] != 0
+        ]
+        for point, _ in stones:
+            self.colors[point] = 0
+        self.__parent[:] = range(len(self.colors))
+        self.hash = 0
+        self.stones_count = [0, 0, 0]
+        self.__stones.clear()
+        self.__liberties.clear()
+
+        for point, color in stones:
+            self.add_stone(point, color)
+        self.__dirty.update(self.goban.points())
+        self.__changed.update(self.goban.points())
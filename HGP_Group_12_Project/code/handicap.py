@@ -11,13 +11,17 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QMessageBox,
     QDoubleSpinBox,
+    QSpinBox,
 )
+from game_logic import GameLogic
 
 
 class HandicapDialog(QDialog):
 
     player_index = {"White Player": 1, "Black Player": 2, "None": 0}
     index_to_player = {1: "White Player", 2: "Black Player", 0: "None"}
+    board_sizes = ["9", "13", "19"]
+    max_board_size = 25
 
     def __init__(self, handicaps: dict):
         super().__init__()
@@ -26,10 +30,12 @@ class HandicapDialog(QDialog):
         self.selected_type = handicaps["type"]
         self.selected_value = handicaps["value"]
         self.selected_komi = handicaps["komi"]
+        self.selected_ko = handicaps["ko"]
+        self.selected_size = handicaps["size"]
 
         self.init_ui()
 
-        self.setFixedSize(400, 200)
+        self.setFixedSize(400, 280)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -56,6 +62,43 @@ class HandicapDialog(QDialog):
 
         layout.addLayout(player_layout)
 
+        # Combo box for the ko rule
+        ko_layout = QHBoxLayout()
+        self.ko_label = QLabel("Ko rule:")
+        self.ko_combo = QComboBox()
+        self.ko_combo.addItems(GameLogic.KO_RULES)
+        self.ko_combo.setCurrentText(self.selected_ko)
+        self.ko_combo.currentTextChanged.connect(self.update_ko)
+
+        ko_layout.addWidget(self.ko_label)
+        ko_layout.addWidget(self.ko_combo)
+
+        layout.addLayout(ko_layout)
+
+        # Combo box for the board size, with a spin box for custom sizes
+        size_layout = QHBoxLayout()
+        self.size_label = QLabel("Board size:")
+        self.size_combo = QComboBox()
+        self.size_combo.addItems(self.board_sizes + ["Custom"])
+        self.size_spin_box = QSpinBox()
+        self.size_spin_box.setRange(5, self.max_board_size)
+        self.size_spin_box.setValue(self.selected_size)
+
+        if str(self.selected_size) in self.board_sizes:
+            self.size_combo.setCurrentText(str(self.selected_size))
+            self.size_spin_box.setEnabled(False)
+        else:
+            self.size_combo.setCurrentText("Custom")
+
+        self.size_combo.currentTextChanged.connect(self.update_size)
+        self.size_spin_box.valueChanged.connect(self.update_size)
+
+        size_layout.addWidget(self.size_label)
+        size_layout.addWidget(self.size_combo)
+        size_layout.addWidget(self.size_spin_box)
+
+        layout.addLayout(size_layout)
+
         # Area for handicap type and value
         self.handicap_layout = QVBoxLayout()
 
@@ -128,6 +171,19 @@ class HandicapDialog(QDialog):
         """Update the selected Komi value."""
         self.selected_komi = komi
 
+    def update_ko(self, ko):
+        """Update the selected ko rule."""
+        self.selected_ko = ko
+
+    def update_size(self, value=None):
+        """Update the selected board size."""
+        if self.size_combo.currentText() == "Custom":
+            self.size_spin_box.setEnabled(True)
+            self.selected_size = self.size_spin_box.value()
+        else:
+            self.size_spin_box.setEnabled(False)
+            self.selected_size = int(self.size_combo.currentText())
+
     def get_results(self):
         """Return the selected handicap and Komi information."""
         return {
@@ -139,4 +195,6 @@ class HandicapDialog(QDialog):
             ),
             "value": (self.spin_box.value() if self.spin_box.isEnabled() else None),
             "komi": self.selected_komi,
+            "ko": self.selected_ko,
+            "size": self.selected_size,
         }
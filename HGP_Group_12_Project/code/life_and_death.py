@@ -0,0 +1,124 @@
+from goban import Goban
+from group_table import GroupTable
+from transposition import TranspositionTable, position_key, target_keys
+
+
+class CaptureSolver(object):
+    """
+    Tactical reading of the life of a group: can the attacker capture it, the attacker moving first
+    Only the groups with one or two liberties are read, the attacker plays on the liberties and the
+    defender extends or captures the attacking stones in atari, like a ladder or a net reader
+    A group reaching three liberties is considered alive, the reading stops at the given depth
+    The results are kept in the transposition table of the position, the target and the player to move
+    """
+
+    MAX_DEPTH = 16  # moves read ahead
+    CAPTURED = 1
+    ALIVE = -1
+
+    def __init__(self, size, table=None):
+        self.size = size
+        self.table = table if table is not None else TranspositionTable()
+        self.nodes = 0  # positions read by the last call
+
+    def captured(self, cells, target, attacker, ko_point=None, depth=MAX_DEPTH):
+        """
+        Say if the group of the stone on the target point is captured with the attacker to move
+        """
+        goban = Goban(self.size, bytearray(cells))
+        self.__groups = GroupTable(goban)
+        self.__target = target
+        self.__target_key = target_keys(self.size)[target]
+        self.nodes = 0
+        return self.__read(attacker, attacker, ko_point, depth)
+
+    def __play(self, point, color):
+        """
+        Put the stone, return the captured points and the new ko point
+        """
+        groups = self.__groups
+        captured = groups.add_stone(point, color)
+        ko_point = None
+        if (
+            len(captured) == 1
+            and len(groups.group(point)) == 1
+            and len(groups.liberties(point)) == 1
+        ):
+            ko_point = captured[0]
+        return captured, ko_point
+
+    def __undo(self, point, color, captured):
+        self.__groups.remove_stone(point)
+        for stone in captured:
+            self.__groups.add_stone(stone, 3 - color)
+
+    def __legal(self, point, color, ko_point):
+        return (
+            point != ko_point
+            and self.__groups.colors[point] == 0
+            and not self.__groups.is_suicide(point, color)
+        )
+
+    def __read(self, attacker, player, ko_point, depth):
+        groups = self.__groups
+        if groups.colors[self.__target] != 3 - attacker:
+            return True  # the group was taken off the board
+
+        liberties = groups.liberties(self.__target)
+        if player == attacker and len(liberties) == 1:
+            return self.__legal(next(iter(liberties)), attacker, ko_point)
+        if len(liberties) > 2 or depth == 0:
+            return False
+
+        key = position_key(self.size, groups.hash, player, ko_point) ^ self.__target_key
+        known = self.table.result(key, depth)
+        if known:
+            return known == self.CAPTURED
+
+        self.nodes += 1
+        if player == attacker:
+            captured = self.__attack(attacker, ko_point, depth, liberties)
+        else:
+            captured = self.__defend(attacker, ko_point, depth, liberties)
+
+        self.table.store_result(key, depth, self.CAPTURED if captured else self.ALIVE)
+        return captured
+
+    def __attack(self, attacker, ko_point, depth, liberties):
+        """
+        The attacker captures if one of its moves on the liberties leaves no defense
+        """
+        for point in sorted(liberties):
+            if not self.__legal(point, attacker, ko_point):
+                continue
+            captured, new_ko_point = self.__play(point, attacker)
+            result = self.__read(attacker, 3 - attacker, new_ko_point, depth - 1)
+            self.__undo(point, attacker, captured)
+            if result:
+                return True
+        return False
+
+    def __defend(self, attacker, ko_point, depth, liberties):
+        """
+        The group lives if one of the extensions or captures of the defender works
+        """
+        groups = self.__groups
+        defender = 3 - attacker
+        moves = set(liberties)
+        for stone in groups.group(self.__target):
+            for neighbor in groups.neighbors(stone):
+                if (
+                    groups.colors[neighbor] == attacker
+                    and len(groups.liberties(neighbor)) == 1
+                ):
+                    moves |= groups.liberties(neighbor)
+
+        for point in sorted(moves):
+            if not self.__legal(point, defender, ko_point):
+                continue
+            captured, new_ko_point = self.__play(point, defender)
+            result = self.__read(attacker, attacker, new_ko_point, depth - 1)
+            self.__undo(point, defender, captured)
+            if not result:
+                return False
+        return True
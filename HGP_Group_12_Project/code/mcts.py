@@ -0,0 +1,587 @@
+import array
+import atexit
+import math
+import os
+import random
+import time
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from goban import Goban, BORDER
+from group_table import GroupTable
+from transposition import TranspositionTable, position_key
+from life_and_death import CaptureSolver
+
+_worker = None  # search and shared buffers of a worker process of ParallelSearch
+
+
+class Node(object):
+    """
+    Node of the search tree, the move that leads to it and the results of the playouts through it
+    The wins are counted for the player who made the move
+    """
+
+    __slots__ = (
+        "move",
+        "player",
+        "parent",
+        "children",
+        "untried",
+        "visits",
+        "wins",
+        "passes",
+        "key",
+    )
+
+    def __init__(self, move, player, parent, passes):
+        self.move = move  # goban point, None for a pass
+        self.player = player
+        self.parent = parent
+        self.children = []
+        # moves not expanded yet, listed the first time the node is reached
+        self.untried = None
+        self.visits = 0
+        self.wins = 0
+        self.passes = passes  # passes in a row ending with this move
+        self.key = 0  # transposition key of the position after the move
+
+    def select(self, exploration, table):
+        """
+        Return the child with the best UCT value, the win rate of a child is taken from the
+        transposition table when its position was reached more often through other move orders
+        """
+        log_visits = math.log(self.visits)
+
+        def value(child):
+            visits, wins = table.statistics(child.key)
+            if visits <= child.visits:
+                visits, wins = child.visits, child.wins
+            return wins / visits + exploration * math.sqrt(log_visits / child.visits)
+
+        return max(self.children, key=value)
+
+
+class PlayoutBoard(object):
+    """
+    Headless copy of the position used by the search, the group table does the captures
+    The simple ko point is tracked, the superko rules are only applied to the root moves
+    The board of the root is built once per search, every playout starts from a copy of it
+    """
+
+    def __init__(self, size, cells):
+        self.goban = Goban(size, bytearray(cells))
+        self.groups = GroupTable(self.goban)
+        self.colors = self.goban.cells
+        self.ko_point = None  # point forbidden to the next move by the simple ko rule
+        self.empty = [point for point in self.goban.points() if self.colors[point] == 0]
+
+    def copy(self):
+        """
+        Return an independent board of the same position, the group table is copied, not rebuilt
+        """
+        board = PlayoutBoard.__new__(PlayoutBoard)
+        board.groups = self.groups.copy()
+        board.goban = board.groups.goban
+        board.colors = board.goban.cells
+        board.ko_point = self.ko_point
+        board.empty = self.empty[:]
+        return board
+
+    def is_eye(self, point, color):
+        """
+        Say if the empty point is only surrounded by the color, filling it would waste an eye
+        """
+        colors = self.colors
+        for neighbor in self.groups.neighbors(point):
+            if colors[neighbor] != color and colors[neighbor] != BORDER:
+                return False
+        return True
+
+    def is_candidate(self, point, color):
+        """
+        Say if the point is a sensible move of the color: legal and not filling an own eye
+        """
+        return (
+            point != self.ko_point
+            and not self.is_eye(point, color)
+            and not self.groups.is_suicide(point, color)
+        )
+
+    def candidates(self, color):
+        return [point for point in self.empty if self.is_candidate(point, color)]
+
+    def play(self, point, color):
+        if point is None:
+            self.ko_point = None
+            return
+        groups = self.groups
+        captured = groups.add_stone(point, color)
+        self.empty.remove(point)
+        self.empty.extend(captured)
+        if (
+            len(captured) == 1
+            and len(groups.group(point)) == 1
+            and len(groups.liberties(point)) == 1
+        ):
+            self.ko_point = captured[0]
+        else:
+            self.ko_point = None
+
+    def random_move(self, color, generator):
+        """
+        Return a random candidate move of the color, None to pass when there is none
+        """
+        empty = self.empty
+        count = len(empty)
+        if not count:
+            return None
+        start = generator.randrange(count)
+        for index in range(start, start + count):
+            point = empty[index % count]
+            if self.is_candidate(point, color):
+                return point
+        return None
+
+    def area_score(self):
+        """
+        Return the stones and the empty points surrounded by each player, index 0 unused
+        Once a playout is over the empty points left are single eyes, they are counted by their neighbors
+        """
+        colors = self.colors
+        score = list(self.groups.stones_count)
+        for point in self.empty:
+            owners = {colors[neighbor] for neighbor in self.groups.neighbors(point)} - {
+                BORDER
+            }
+            if len(owners) == 1:
+                score[owners.pop()] += 1
+        return score
+
+
+class MonteCarloTreeSearch(object):
+    """
+    Monte Carlo tree search with the UCT selection for the computer player
+    Every iteration replays the moves of the tree on a headless copy of the position,
+    expands one new node and finishes the game with random moves, the winner is backed up
+    The search runs until its time budget is spent, the most visited root move is played
+    The tree is kept between two searches: when the new position follows the previous root by
+    one or two moves, the matching subtree is promoted to the new root with its statistics
+    The results are also summed by position in the transposition table, shared with the capture
+    solver that keeps the root from running a group in atari into a working ladder
+    """
+
+    EXPLORATION = 1.0  # weight of the exploration term of UCT
+    THINKING_TIME = 1.0  # default time budget in seconds
+    PONDER_FACTOR = 10  # longest search on the time of the opponent, in thinking times
+
+    def __init__(self, size, komi, seed=None, table=None):
+        self.size = size
+        self.komi = komi  # (komi of white, komi of black)
+        self.exploration = self.EXPLORATION
+        self.generator = random.Random(seed)
+        # playouts longer than this are stopped and scored
+        self.max_moves = 3 * size * size
+        self.playouts = 0  # playouts of the last search
+        self.elapsed = 0.0  # duration of the last search in seconds
+        self.reused = 0  # visits of the root taken over from the previous search
+        self.root = None
+        self.root_cells = None  # cells of the position of the root
+        self.root_ko_point = None
+        self.root_board = None  # board of the root position, copied by every iteration
+        self.table = table if table is not None else TranspositionTable()
+        self.solver = CaptureSolver(size, self.table)
+
+    def playouts_per_second(self):
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+    def close(self):
+        """
+        Nothing to free, same interface as ParallelSearch
+        """
+
+    def search(
+        self,
+        cells,
+        player,
+        legal_mask,
+        passes=0,
+        thinking_time=THINKING_TIME,
+        allow_pass=True,
+        stop=None,
+        max_visits=None,
+        ko_point=None,
+    ):
+        """
+        Search the position for the player and return the chosen point, None to pass
+        The root moves are the legal moves of the mask, which already applies the ko rule of the game
+        passes is the number of passes in a row before the move, a pass after a pass ends the game
+        stop is called between two iterations, the search ends early once it returns True
+        or once the root has max_visits visits, the reused ones included
+        ko_point is the point forbidden by the simple ko, part of the transposition key
+        """
+        start = time.perf_counter()
+        deadline = start + thinking_time
+        self.table.new_generation()
+
+        board = PlayoutBoard(self.size, cells)
+        board.ko_point = ko_point
+        root = self.promote(cells, player) or Node(None, 3 - player, None, passes)
+        if root.untried is None:
+            root.untried = [
+                point for point in board.empty if not board.is_eye(point, player)
+            ]
+            root.untried.append(None)
+            self.generator.shuffle(root.untried)
+        root.parent = None
+        root.passes = passes
+        root.key = position_key(self.size, board.groups.hash, player, ko_point)
+
+        # the ko rule of the game only allows the moves of the mask, the extensions into a lost ladder are dropped
+        lost = self.lost_extensions(board, player)
+        allowed = [
+            point
+            for point in root.untried
+            if point is None or (legal_mask[point] and point not in lost)
+        ]
+        children = [
+            child
+            for child in root.children
+            if child.move is None or (legal_mask[child.move] and child.move not in lost)
+        ]
+        if not allowed and not children:
+            allowed = [
+                point for point in root.untried if point is None or legal_mask[point]
+            ]
+            children = [
+                child
+                for child in root.children
+                if child.move is None or legal_mask[child.move]
+            ]
+        if not allow_pass and any(
+            move is not None for move in allowed + [child.move for child in children]
+        ):
+            allowed = [point for point in allowed if point is not None]
+            children = [child for child in children if child.move is not None]
+        root.untried, root.children = allowed, children
+        root.visits = sum(child.visits for child in children)
+
+        self.root, self.root_cells, self.root_ko_point = root, bytes(cells), ko_point
+        self.root_board = board
+        self.reused = root.visits
+        self.playouts = 0
+        while True:
+            self.iterate()
+            self.playouts += 1
+            if (
+                time.perf_counter() >= deadline
+                or (stop and stop())
+                or (max_visits and self.root.visits >= max_visits)
+            ):
+                break
+
+        self.elapsed = time.perf_counter() - start
+        return self.best_move()
+
+    def promote(self, cells, player):
+        """
+        Return the node of the previous tree for the position with the player to move, None if
+        the position is not one or two moves after the previous root
+        The moves are found from the stones added to the board, a pass when no stone was added
+        """
+        if self.root is None:
+            return None
+        node = self.root
+        board = PlayoutBoard(self.size, self.root_cells)
+        board.ko_point = self.root_ko_point
+        for _ in range(3):
+            if board.colors == cells and node.player == 3 - player:
+                return node
+            mover = 3 - node.player
+            child = next(
+                (
+                    child
+                    for child in node.children
+                    if child.move is not None
+                    and board.colors[child.move] == 0
+                    and cells[child.move] == mover
+                ),
+                None,
+            )
+            if child is None:
+                child = next(
+                    (child for child in node.children if child.move is None), None
+                )
+            if child is None:
+                return None
+            board.play(child.move, mover)
+            node = child
+        return None
+
+    def lost_extensions(self, board, player):
+        """
+        Return the liberties of the groups of the player in atari where extending still gets captured
+        """
+        lost = set()
+        groups = board.groups
+        seen = set()
+        for point in board.goban.points():
+            if board.colors[point] != player or groups.find(point) in seen:
+                continue
+            seen.add(groups.find(point))
+            liberties = groups.liberties(point)
+            if len(liberties) != 1:
+                continue
+            liberty = next(iter(liberties))
+            if not board.is_candidate(liberty, player):
+                continue
+            extended = board.copy()
+            extended.play(liberty, player)
+            if len(extended.groups.liberties(liberty)) <= 2 and self.solver.captured(
+                extended.colors, liberty, 3 - player, extended.ko_point
+            ):
+                lost.add(liberty)
+        return lost
+
+    def best_move(self):
+        if not self.root.children:
+            return None
+        return max(self.root.children, key=lambda child: child.visits).move
+
+    def iterate(self):
+        """
+        One selection, expansion, playout and backup from the root
+        """
+        board = self.root_board.copy()
+        node = self.root
+
+        # selection
+        while not node.untried and node.children:
+            node = node.select(self.exploration, self.table)
+            board.play(node.move, node.player)
+
+        # expansion
+        if node.passes < 2:
+            if node.untried is None:
+                node.untried = board.candidates(3 - node.player)
+                node.untried.append(None)
+                self.generator.shuffle(node.untried)
+            move = node.untried.pop()
+            child = Node(
+                move, 3 - node.player, node, 0 if move is not None else node.passes + 1
+            )
+            node.children.append(child)
+            node = child
+            board.play(move, node.player)
+            node.key = position_key(
+                self.size, board.groups.hash, 3 - node.player, board.ko_point
+            )
+
+        # playout and backup
+        winner = self.playout(board, 3 - node.player, node.passes)
+        table = self.table
+        while node is not None:
+            node.visits += 1
+            win = node.player == winner
+            node.wins += win
+            table.add_result(node.key, win)
+            node = node.parent
+
+    def playout(self, board, player, passes):
+        """
+        Finish the game with random moves and return the winner
+        """
+        generator = self.generator
+        moves = 0
+        while passes < 2 and moves < self.max_moves:
+            point = board.random_move(player, generator)
+            board.play(point, player)
+            passes = passes + 1 if point is None else 0
+            player = 3 - player
+            moves += 1
+
+        score = board.area_score()
+        return 1 if score[1] + self.komi[0] > score[2] + self.komi[1] else 2
+
+
+class ParallelSearch(object):
+    """
+    Root parallel Monte Carlo tree search over a pool of processes
+    Every worker searches the same root with its own random playouts for the whole time budget,
+    then the visits and wins of the root moves are summed, the most visited move is played
+    One task is sent per worker, each one stops at the deadline of the search so a late task
+    does not make the search last longer
+    The workers keep their trees between two searches for the tree reuse, each one with its own
+    transposition table, the memory cap is split between them
+    The position and the statistics go through shared memory buffers, only the small task
+    arguments and the playout counts are pickled:
+    position: cells, legal mask, each one byte per goban point, then the stop flag
+    statistics: (visits, wins) of every root move as 64 bits integers, one row per worker,
+    the last column is the pass
+    """
+
+    # seconds between two checks of the stop callable while the workers search
+    POLL_INTERVAL = 0.01
+
+    def __init__(
+        self, size, komi, workers=None, memory=TranspositionTable.DEFAULT_MEMORY
+    ):
+        self.size = size
+        self.workers = workers or os.cpu_count() or 1
+        self.generator = random.Random()
+        self.playouts = 0  # playouts of the last search, all workers together
+        self.elapsed = 0.0
+        # root visits taken over from the previous trees, all workers together
+        self.reused = 0
+        self.visits = {}  # point -> merged visits of the root moves of the last search
+
+        self.__cells = (size + 2) * (size + 2)
+        self.__position = SharedMemory(create=True, size=2 * self.__cells + 1)
+        self.__statistics = SharedMemory(
+            create=True, size=self.workers * (self.__cells + 1) * 2 * 8
+        )
+        self.__pool = Pool(
+            self.workers,
+            initializer=init_worker,
+            initargs=(
+                size,
+                komi,
+                memory // self.workers,
+                self.__position.name,
+                self.__statistics.name,
+            ),
+        )
+        atexit.register(self.close)
+
+    def playouts_per_second(self):
+        return self.playouts / self.elapsed if self.elapsed else 0.0
+
+    def search(
+        self,
+        cells,
+        player,
+        legal_mask,
+        passes=0,
+        thinking_time=MonteCarloTreeSearch.THINKING_TIME,
+        allow_pass=True,
+        stop=None,
+        max_visits=None,
+        ko_point=None,
+    ):
+        """
+        Same as MonteCarloTreeSearch.search, spread over the workers, max_visits is shared between them
+        The stop callable is polled while waiting, the shared stop flag then ends the workers early
+        """
+        start = time.perf_counter()
+        deadline = time.time() + thinking_time  # wall clock, the same in every process
+        count = self.__cells
+        self.__position.buf[:count] = cells
+        self.__position.buf[count : 2 * count] = legal_mask
+        self.__position.buf[2 * count] = 0
+
+        worker_visits = max_visits and -(-max_visits // self.workers)
+        tasks = [
+            (
+                row,
+                self.generator.getrandbits(32),
+                player,
+                passes,
+                deadline,
+                allow_pass,
+                worker_visits,
+                ko_point,
+            )
+            for row in range(self.workers)
+        ]
+        results = [self.__pool.apply_async(search_worker, (task,)) for task in tasks]
+        for result in results:
+            while not result.ready():
+                result.wait(self.POLL_INTERVAL)
+                if stop and stop():
+                    self.__position.buf[2 * count] = 1
+        counts = [result.get() for result in results]
+        self.playouts = sum(playouts for playouts, _ in counts)
+        self.reused = sum(reused for _, reused in counts)
+
+        statistics = self.__statistics.buf.cast("q")
+        width = 2 * (count + 1)
+        self.visits = {}
+        for row in range(self.workers):
+            offset = row * width
+            for index in range(count + 1):
+                visits = statistics[offset + 2 * index]
+                if visits:
+                    point = index if index < count else None
+                    self.visits[point] = self.visits.get(point, 0) + visits
+        statistics.release()
+
+        self.elapsed = time.perf_counter() - start
+        if not self.visits:
+            return None
+        return max(self.visits, key=self.visits.get)
+
+    def close(self):
+        """
+        Stop the workers and free the shared memory
+        """
+        if self.__pool is None:
+            return
+        self.__pool.terminate()
+        self.__pool.join()
+        self.__pool = None
+        for shared in (self.__position, self.__statistics):
+            shared.close()
+            shared.unlink()
+        atexit.unregister(self.close)
+
+
+def computer_search(size, komi):
+    """
+    Return the search of the computer player, always run by worker processes even on a single core
+    so that the search never holds the interpreter lock of the GUI
+    """
+    return ParallelSearch(size, komi)
+
+
+def init_worker(size, komi, memory, position_name, statistics_name):
+    global _worker
+    _worker = (
+        MonteCarloTreeSearch(size, komi, table=TranspositionTable(memory)),
+        SharedMemory(name=position_name),
+        SharedMemory(name=statistics_name),
+    )
+
+
+def search_worker(task):
+    """
+    Search the shared position until the deadline and write the root statistics in the row
+    of the worker, return the number of playouts and of reused root visits
+    """
+    row, seed, player, passes, deadline, allow_pass, max_visits, ko_point = task
+    search, position, statistics = _worker
+    count = (search.size + 2) * (search.size + 2)
+
+    search.generator.seed(seed)
+    cells = bytes(position.buf[:count])
+    legal_mask = bytes(position.buf[count : 2 * count])
+    search.search(
+        cells,
+        player,
+        legal_mask,
+        passes,
+        max(0.0, deadline - time.time()),
+        allow_pass,
+        stop=lambda: position.buf[2 * count] != 0,
+        max_visits=max_visits,
+        ko_point=ko_point,
+    )
+
+    width = 2 * (count + 1)
+    values = [0] * width
+    for child in search.root.children:
+        index = count if child.move is None else child.move
+        values[2 * index] = child.visits
+        values[2 * index + 1] = child.wins
+
+    table = statistics.buf.cast("q")
+    table[row * width : (row + 1) * width] = array.array("q", values)
+    table.release()
+    return search.playouts, search.reused
@@ -0,0 +1,57 @@
+from goban import Goban
+from group_table import GroupTable
+
+
+class GameReplay(object):
+    """
+    Replay of a recorded game that can jump to any move
+    A compact copy of the cells and the prisoners is kept every few moves, seeking restores
+    the nearest checkpoint before the wanted move and plays only the moves in between
+    Stepping forward from the current move does not need any checkpoint
+    """
+
+    CHECKPOINT_INTERVAL = 16  # moves between two checkpoints
+
+    def __init__(self, size, moves, interval=CHECKPOINT_INTERVAL):
+        self.board = Goban(size)
+        self.moves = moves  # (state, (row, col)), the position is None for a pass
+        self.interval = interval
+        self.prisoners = [0, 0, 0]  # prisoners won by each player, index 0 unused
+        self.move_number = 0  # number of moves played on the board
+        self.__groups = GroupTable(self.board)
+        self.__checkpoints = [self.__snapshot()]
+
+        for move in moves:
+            self.__play(move)
+            if self.move_number % interval == 0:
+                self.__checkpoints.append(self.__snapshot())
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __snapshot(self):
+        return bytes(self.board.cells), tuple(self.prisoners)
+
+    def __play(self, move):
+        state, position = move
+        if position is not None:
+            captured = self.__groups.add_stone(self.board.point(*position), state)
+            self.prisoners[state] += len(captured)
+        self.move_number += 1
+
+    def seek(self, move_number):
+        """
+        Show the position after the given number of moves
+        """
+        move_number = min(max(move_number, 0), len(self.moves))
+        checkpoint = move_number // self.interval
+
+        if not checkpoint * self.interval <= self.move_number <= move_number:
+            cells, prisoners = self.__checkpoints[checkpoint]
+            self.board.cells[:] = cells
+            self.__groups.rebuild()
+            self.prisoners = list(prisoners)
+            self.move_number = checkpoint * self.interval
+
+        while self.move_number < move_number:
+            self.__play(self.moves[self.move_number])
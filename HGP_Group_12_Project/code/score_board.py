@@ -6,8 +6,11 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QMessageBox,
+    QSlider,
+    QFileDialog,
+    QCheckBox,
 )
-from PyQt6.QtCore import pyqtSignal, pyqtSlot
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 
 
 class ScoreBoard(QDockWidget):
@@ -29,6 +32,7 @@ class ScoreBoard(QDockWidget):
         self.gamemode = 0  # 0 for normal game, 1 for blitz game
         self.time_remaining_p1 = 0
         self.time_remaining_p2 = 0
+        self.player_names = ("White Player", "Black Player")
 
     def initUI(self):
         """Initiates ScoreBoard UI"""
@@ -57,10 +61,25 @@ class ScoreBoard(QDockWidget):
         self.button_prev = QPushButton("Previous Move")
         self.button_next = QPushButton("Next Move")
 
+        # History buttons for committed moves
+        self.button_undo = QPushButton("Undo")
+        self.button_redo = QPushButton("Redo")
+
+        # Replay slider to review the played moves
+        self.label_replay = QLabel("Move: 0 / 0")
+        self.slider_replay = QSlider(Qt.Orientation.Horizontal)
+        self.slider_replay.setRange(0, 0)
+
         self.button_resign = QPushButton("Resign")
         self.button_dispute_not_success = QPushButton("Dispute Not Successful")
         self.button_dispute_not_success.setVisible(False)
         self.button_reset = QPushButton("Reset Game")
+        self.button_save = QPushButton("Save Game")
+        self.button_load = QPushButton("Load Game")
+
+        # Display options of the goban
+        self.checkbox_coordinates = QCheckBox("Show Coordinates")
+        self.button_theme = QPushButton("Change Background")
 
         # Create top bar with Rules and Controls buttons
         self.topBar = QWidget()
@@ -101,15 +120,42 @@ class ScoreBoard(QDockWidget):
         navigationLayout.addWidget(self.button_next)
         self.mainLayout.addLayout(navigationLayout)
 
+        historyLayout = QHBoxLayout()
+        historyLayout.addWidget(self.button_undo)
+        historyLayout.addWidget(self.button_redo)
+        self.mainLayout.addLayout(historyLayout)
+
+        self.mainLayout.addWidget(self.label_replay)
+        self.mainLayout.addWidget(self.slider_replay)
+
         self.mainLayout.addWidget(self.button_resign)
         self.mainLayout.addWidget(self.button_dispute_not_success)
         self.mainLayout.addWidget(self.button_reset)
 
+        recordLayout = QHBoxLayout()
+        recordLayout.addWidget(self.button_save)
+        recordLayout.addWidget(self.button_load)
+        self.mainLayout.addLayout(recordLayout)
+
+        displayLayout = QHBoxLayout()
+        displayLayout.addWidget(self.checkbox_coordinates)
+        displayLayout.addWidget(self.button_theme)
+        self.mainLayout.addLayout(displayLayout)
+
         self.setWidget(self.mainWidget)
 
         self.button_rules.clicked.connect(self.showKoSuicideRules)
         self.button_controls.clicked.connect(self.showControls)
 
+        # Connected once, these slots look up the board of the current game
+        self.button_undo.clicked.connect(self.undoMove)
+        self.button_redo.clicked.connect(self.redoMove)
+        self.slider_replay.valueChanged.connect(self.seekReplay)
+        self.button_save.clicked.connect(self.saveGame)
+        self.button_load.clicked.connect(self.loadGame)
+        self.checkbox_coordinates.toggled.connect(self.setShowCoordinates)
+        self.button_theme.clicked.connect(self.changeTheme)
+
         # Hide time remaining labels initially
         self.label_timeRemaining_p1.setVisible(False)
         self.label_timeRemaining_p2.setVisible(False)
@@ -170,6 +216,14 @@ class ScoreBoard(QDockWidget):
         self.label_territory_p1.setText(f"White Territory: {territory_p1}")
         self.label_territory_p2.setText(f"Black Territory: {territory_p2}")
 
+    def updateReplay(self, move_number, total):
+        """Move the replay slider without seeking the board again"""
+        self.slider_replay.blockSignals(True)
+        self.slider_replay.setRange(0, total)
+        self.slider_replay.setValue(move_number)
+        self.slider_replay.blockSignals(False)
+        self.label_replay.setText(f"Move: {move_number} / {total}")
+
     def updateTurn(self, player_turn):
         color = "black" if player_turn == 2 else "white"
         self.label_turn.setText(f"Turn: Player {player_turn} ({color}) to play")
@@ -185,6 +239,7 @@ class ScoreBoard(QDockWidget):
         QMessageBox.information(self, "Rules of Ko and Suicide", rules)
 
     def updatePlayerNames(self, player1, player2):
+        self.player_names = (player1, player2)
         self.label_player1.setText(f"White Player: {player1}")
         self.label_player2.setText(f"Black Player: {player2}")
 
@@ -194,12 +249,64 @@ class ScoreBoard(QDockWidget):
             "- Click again on the current temporary Stone to confirm the move.\n\n"
             '- Click on "Pass" to pass your turn.\nReminder: 2 passes = end of game\n\n'
             '- Click on "Previous Move" and "Next Move" to navigate between all of your tempory place stone\n\n'
+            '- Click on "Undo" and "Redo" to take back a played move or play it again\n\n'
+            "- Drag the move slider to review the game, drag it to the end to play again\n\n"
             '- Click on "Resign" to declare forfeit\n\n'
             '- Click on "Dispute Not Successful" if you don\'t find an agreement during the dispute phase'
-            '- Click on "Reset Game" to clear the board and restart.'
+            '- Click on "Reset Game" to clear the board and restart.\n\n'
+            '- Click on "Save Game" and "Load Game" to keep a game in an SGF file and play it again later\n\n'
+            '- Tick "Show Coordinates" to label the lines and click on "Change Background" to pick another goban image'
         )
         QMessageBox.information(self, "Controls", controls)
 
+    def saveGame(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save Game", "game.sgf", "SGF files (*.sgf)"
+        )
+        if path:
+            try:
+                self.board.saveGame(path)
+            except OSError as error:
+                QMessageBox.warning(
+                    self, "Save Game", f"Could not save the game:\n{error}"
+                )
+
+    def loadGame(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Load Game", "", "SGF files (*.sgf)"
+        )
+        if path:
+            error = self.board.loadGame(path)
+            if error:
+                QMessageBox.warning(
+                    self, "Load Game", f"Could not load the game:\n{error}"
+                )
+
+    def undoMove(self):
+        if self.board is not None:
+            self.board.undoMove()
+
+    def redoMove(self):
+        if self.board is not None:
+            self.board.redoMove()
+
+    def seekReplay(self, move_number):
+        if self.board is not None:
+            self.board.seekReplay(move_number)
+
+    def setShowCoordinates(self, show):
+        if self.board is not None:
+            self.board.setShowCoordinates(show)
+
+    def changeTheme(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Change Background", "", "Images (*.png *.jpg *.jpeg *.bmp)"
+        )
+        if path and self.board is not None and not self.board.setTheme(path):
+            QMessageBox.warning(
+                self, "Change Background", f"Could not load the image:\n{path}"
+            )
+
     def resign(self):
         self.resignSignal.emit(self.board.player_turn)
 
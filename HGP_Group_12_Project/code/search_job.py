@@ -0,0 +1,42 @@
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class SearchToken(object):
+    """
+    Cancellation token of a background job, cancelled as soon as the position it was started on changes
+    The job checks it between two iterations and its result is dropped once cancelled
+    """
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def is_cancelled(self):
+        return self.cancelled
+
+
+class SearchSignals(QObject):
+    finished = pyqtSignal(object, object)  # token and result of the job
+
+
+class SearchJob(QRunnable):
+    """
+    Engine call run on a thread of a QThreadPool so that the event loop keeps running
+    The function gets the stop callable of the token, the result is delivered through the
+    finished signal, which is queued to the thread of the receiver
+    """
+
+    def __init__(self, token, function, *args, **kwargs):
+        super().__init__()
+        self.token = token
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = SearchSignals()
+
+    def run(self):
+        result = self.function(*self.args, stop=self.token.is_cancelled, **self.kwargs)
+        if not self.token.is_cancelled():
+            self.signals.finished.emit(self.token, result)
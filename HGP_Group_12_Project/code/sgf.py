@@ -0,0 +1,285 @@
+import re
+
+CHUNK_SIZE = 1 << 20  # characters read at once from the stream
+COORDINATES = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# a token is a parenthesis, a run of plain move nodes or a node with any properties,
+# a node is complete once the next node or parenthesis is in sight
+TOKEN = re.compile(
+    r"(\()|(\))"
+    r"|((?:;[BW]\[[a-zA-Z]{0,2}\]\s?)+(?=[;()]))"
+    r"|(;(?:\s*[A-Za-z]+(?:\s*\[[^\]\\]*(?:\\.[^\]\\]*)*\])+)*(?=\s*[;()]))",
+    re.S,
+)
+OPEN, CLOSE, RUN, NODE = 1, 2, 3, 4  # kinds of tokens, the group of the token
+MOVE = re.compile(r";\s*([BW])\s*\[([a-zA-Z]{0,2})\]")
+# identifier, empty for the next values of the same property, and value
+PROPERTY = re.compile(r"([A-Za-z]*)\s*\[([^\]\\]*(?:\\.[^\]\\]*)*)\]", re.S)
+ESCAPE = re.compile(r"\\(\n\r?|\r\n?|.)", re.S)
+STATES = {"W": 1, "B": 2}
+_points = {}
+_move_nodes = {}
+
+
+class SgfGame(object):
+    """
+    Main line of a game record in the SGF FF[4] format
+    Positions are (row, col) with row 0 at the top like on the board, None for a pass
+    """
+
+    def __init__(self, size=19):
+        self.size = size
+        self.komi = 6.5
+        self.handicap = 0  # number of handicap stones
+        self.black = ""  # name of the black player
+        self.white = ""
+        self.result = ""  # like "B+R", "W+12.5", "0" or "Void"
+        self.date = ""
+        self.setup = []  # (state, position) of the stones put before the first move
+        self.moves = []  # (state, position) of the moves, position None for a pass
+        # why the record could not be read, the rest of the game is skipped
+        self.error = ""
+
+
+def parse_value(value):
+    """
+    Unescape a property value, a soft line break is removed
+    """
+    return ESCAPE.sub(
+        lambda match: "" if match.group(1)[0] in "\r\n" else match.group(1), value
+    )
+
+
+def parse_point(value, size):
+    """
+    Return the (row, col) of a point value, None for a pass
+    """
+    if len(value) != 2 or (value == "tt" and size <= 19):
+        return None
+    if value[0] not in COORDINATES or value[1] not in COORDINATES:
+        raise ValueError(f"Invalid point {value}")
+    return COORDINATES.index(value[1]), COORDINATES.index(value[0])
+
+
+def points(size):
+    """
+    Return the positions of all the point values of the size, including the passes
+    """
+    if size not in _points:
+        _points[size] = {
+            COORDINATES[col] + COORDINATES[row]: (row, col)
+            for row in range(size)
+            for col in range(size)
+        }
+        _points[size][""] = None
+        if size <= 19:
+            _points[size]["tt"] = None
+    return _points[size]
+
+
+def move_nodes(size):
+    """
+    Return the moves of all the plain move nodes of the size, like "B[pd]" -> (2, (15, 3))
+    """
+    if size not in _move_nodes:
+        _move_nodes[size] = {
+            f"{color}[{value}]": (state, position)
+            for color, state in STATES.items()
+            for value, position in points(size).items()
+        }
+    return _move_nodes[size]
+
+
+def format_point(position):
+    if position is None:
+        return ""
+    row, col = position
+    return COORDINATES[col] + COORDINATES[row]
+
+
+def parse_node(text):
+    """
+    Return the properties of a node as {identifier: [values]}
+    """
+    properties = {}
+    values = None
+    for identifier, value in PROPERTY.findall(text):
+        if identifier:
+            values = properties[identifier] = []
+        values.append(value)
+    return properties
+
+
+def tokens(stream, chunk_size=None):
+    """
+    Read the stream by chunks and yield the (kind, text) of its tokens, only the incomplete
+    end of a chunk is kept for the next one so the memory does not depend on the size of the stream
+    """
+    buffer = ""
+    while True:
+        chunk = stream.read(chunk_size or CHUNK_SIZE)
+        buffer += chunk
+        end = 0
+        for match in TOKEN.finditer(buffer):
+            if chunk and buffer.find("[", end, match.start()) != -1:
+                break  # skipped text with a value, a node cut by the end of the chunk
+            yield match.lastindex, match.group()
+            end = match.end()
+
+        if not chunk:
+            return
+        buffer = buffer[end:]
+
+
+def read_games(stream):
+    """
+    Yield the main line of every game of an SGF collection
+    The parser is not recursive and keeps no variation: it only counts the depth of the
+    parentheses, the main line goes through the first child of every tree
+    """
+    depth = 0
+    main_depth = 0  # depth of the tree of the main line being read
+    done = False  # the main line of the current game is complete
+    game = None
+
+    for kind, token in tokens(stream):
+        if kind == OPEN:
+            depth += 1
+            if depth == 1:
+                main_depth, done, game = 1, False, None
+            elif not done and depth == main_depth + 1:
+                main_depth = depth  # first variation, part of the main line
+
+        elif kind == CLOSE:
+            if not done and depth == main_depth:
+                done = True
+            depth -= 1
+            if depth == 0 and game is not None:
+                yield game
+                game = None
+
+        elif not done and depth == main_depth:
+            try:
+                if kind == NODE:
+                    node = parse_node(token)
+                    if game is None:
+                        game = root_game(node)
+                    add_node(game, node)
+                else:
+                    if game is None:
+                        game = SgfGame()
+                    read_moves(game, token)
+            except ValueError as error:
+                # a bad property only spoils its own game, the next games are still read
+                if game is None:
+                    game = SgfGame()
+                game.error = str(error)
+                done = True
+
+
+def root_game(root):
+    """
+    Create the game from the properties of the root node
+    """
+    size = root.get("SZ", ["19"])[0]
+    game = SgfGame(int(size.split(":")[0]))
+
+    if "KM" in root:
+        game.komi = float(root["KM"][0] or 0)
+    if "HA" in root:
+        game.handicap = int(root["HA"][0] or 0)
+    game.black = parse_value(root.get("PB", [""])[0])
+    game.white = parse_value(root.get("PW", [""])[0])
+    game.result = parse_value(root.get("RE", [""])[0])
+    game.date = parse_value(root.get("DT", [""])[0])
+    return game
+
+
+def add_node(game, node):
+    """
+    Add the setup stones and the move of a node of the main line
+    """
+    for identifier, state in (("AW", 1), ("AB", 2)):
+        for value in node.get(identifier, []):
+            game.setup.append((state, parse_point(value, game.size)))
+    for identifier, state in (("W", 1), ("B", 2)):
+        if identifier in node:
+            game.moves.append((state, parse_point(node[identifier][0], game.size)))
+
+
+def read_moves(game, run):
+    """
+    Add a run of plain move nodes, the common case of a game record
+    """
+    if "\n" in run:
+        run = "".join(run.split())
+    nodes = run.split(";")
+    start = len(game.moves)
+    try:
+        game.moves.extend(map(move_nodes(game.size).__getitem__, nodes[1:]))
+    except KeyError:
+        # point outside the board, slower path
+        del game.moves[start:]
+        for color, value in MOVE.findall(run):
+            game.moves.append((STATES[color], parse_point(value, game.size)))
+
+
+def escape_value(value):
+    return str(value).replace("\\", "\\\\").replace("]", "\\]")
+
+
+def write_game(game, stream):
+    """
+    Write the game in the SGF FF[4] format
+    """
+    root = [
+        ("GM", 1),
+        ("FF", 4),
+        ("CA", "UTF-8"),
+        ("AP", "HGP Go:1.0"),
+        ("SZ", game.size),
+        ("KM", game.komi),
+        ("RU", "Japanese"),
+    ]
+    if game.handicap:
+        root.append(("HA", game.handicap))
+    for identifier, value in (
+        ("PB", game.black),
+        ("PW", game.white),
+        ("DT", game.date),
+        ("RE", game.result),
+    ):
+        if value:
+            root.append((identifier, value))
+
+    stream.write("(;" + "".join(f"{key}[{escape_value(value)}]" for key, value in root))
+    for identifier, state in (("AW", 1), ("AB", 2)):
+        points = [
+            format_point(position) for setup, position in game.setup if setup == state
+        ]
+        if points:
+            stream.write(identifier + "".join(f"[{point}]" for point in points))
+    stream.write("\n")
+
+    for number, (state, position) in enumerate(game.moves, 1):
+        stream.write(f";{'W' if state == 1 else 'B'}[{format_point(position)}]")
+        if number % 10 == 0:
+            stream.write("\n")
+    stream.write(")\n")
+
+
+def load(path):
+    """
+    Return the first game of an SGF file
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for game in read_games(f):
+            if game.error:
+                raise ValueError(game.error)
+            return game
+    raise ValueError(f"No game found in {path}")
+
+
+def save(game, path):
+    with open(path, "w", encoding="utf-8") as f:
+        write_game(game, f)
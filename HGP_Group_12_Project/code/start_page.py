@@ -6,12 +6,15 @@ from PyQt6.QtWidgets import (
     QSpacerItem,
     QSizePolicy,
     QMessageBox,
+    QInputDialog,
 )
 from PyQt6.QtCore import pyqtSignal, Qt, QSize
 
 
 class StartPage(QWidget):
     newGameSignal = pyqtSignal(int)
+    # gamemode and thinking time of the computer
+    newComputerGameSignal = pyqtSignal(int, float)
 
     def __init__(self):
         super().__init__()
@@ -65,7 +68,7 @@ class StartPage(QWidget):
         rules = (
             "Rules of Go:\n"
             '1. Go is a territory control game between "Black" and "White".\n\n'
-            "2. Go is played on a Goban, a squared board, here 9x9.\n\n"
+            "2. Go is played on a Goban, a squared board, here 9x9, 13x13, 19x19 or a custom size up to 25x25.\n\n"
             '3. Every turn, Black or White places a "Stone" in a free intersection on the board.\n\n'
             "4. Totally surrounding an opponent' stone or group of stones will have those captured.\n\n"
             "5. The winner is decided by whoever has the most captured stones and free intersections surrounded by their own stones.\n\n"
@@ -106,6 +109,20 @@ class StartPage(QWidget):
         )
         self.layout.addWidget(button_blitz_game)
 
+        # Add the games against the computer
+        for text, gamemode in (
+            ("Normal Game vs Computer", 0),
+            ("Blitz Game vs Computer", 1),
+        ):
+            button_computer_game = QPushButton(text)
+            button_computer_game.clicked.connect(
+                lambda checked, gamemode=gamemode: self.askThinkingTime(gamemode)
+            )
+            button_computer_game.setSizePolicy(
+                QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
+            )
+            self.layout.addWidget(button_computer_game)
+
         # Add Return button
         button_return = QPushButton("Return")
         button_return.clicked.connect(self.initUI)
@@ -121,6 +138,21 @@ class StartPage(QWidget):
             )
         )
 
+    def askThinkingTime(self, gamemode):
+        """Ask how long the computer may think on each move, then start the game."""
+        thinking_time, accepted = QInputDialog.getDouble(
+            self,
+            "Computer Opponent",
+            "Thinking time of the computer per move (seconds):",
+            1.0,
+            0.1,
+            30.0,
+            1,
+        )
+        if accepted:
+            self.newComputerGameSignal.emit(gamemode, thinking_time)
+            self.initUI()
+
     def clearLayout(self, layout):
         while layout.count():
             item = layout.takeAt(0)
@@ -0,0 +1,77 @@
+from goban import Goban, BORDER
+
+
+class TerritoryIndex(object):
+    """
+    Index of the empty regions of the goban with their points and owner
+    Owner of a region: None if no stone around, 1 or 2 if only surrounded by this color, 0 if mixed
+    Only the regions touched by the points that changed since the last update are labelled again,
+    the territory of each player is kept as a running tally
+    """
+
+    def __init__(self, goban: Goban):
+        self.goban = goban
+        self.territory = [0, 0, 0]  # territory of each owner, index 0 unused
+        # region label of each empty point, 0 otherwise
+        self.__labels = [0] * len(goban.cells)
+        self.__regions = {}  # label -> (points, owner)
+        self.__next_label = 1
+        self.update(goban.points())
+
+    def update(self, changed_points):
+        """
+        Label again the regions containing or touching the changed points
+        """
+        cells = self.goban.cells
+        labels = self.__labels
+
+        discarded = set()
+        for point in changed_points:
+            if labels[point]:
+                discarded.add(labels[point])
+            for neighbor in self.goban.neighbors(point):
+                if labels[neighbor]:
+                    discarded.add(labels[neighbor])
+
+        seeds = list(changed_points)
+        for label in discarded:
+            points, owner = self.__regions.pop(label)
+            if owner:
+                self.territory[owner] -= len(points)
+            for point in points:
+                labels[point] = 0
+            seeds.extend(points)
+
+        for point in seeds:
+            if cells[point] == 0 and not labels[point]:
+                self.__flood_fill(point)
+
+    def __flood_fill(self, start):
+        """Flood fill algorithm to label the region of the start point and find its owner"""
+        cells = self.goban.cells
+        labels = self.__labels
+        label = self.__next_label
+        self.__next_label += 1
+
+        owner = None
+        labels[start] = label
+        points = [start]
+        index = 0
+        while index < len(points):
+            for neighbor in self.goban.neighbors(points[index]):
+                neighbor_state = cells[neighbor]
+                if neighbor_state == 0:
+                    if not labels[neighbor]:
+                        labels[neighbor] = label
+                        points.append(neighbor)
+                elif neighbor_state == BORDER:
+                    continue
+                elif owner is None:
+                    owner = neighbor_state
+                elif owner != neighbor_state:
+                    owner = 0  # Mixed territory
+            index += 1
+
+        self.__regions[label] = (points, owner)
+        if owner:
+            self.territory[owner] += len(points)
@@ -0,0 +1,177 @@
+import random
+from array import array
+from group_table import ZOBRIST_SEED, TURN_KEYS
+
+_ko_keys = {}
+_target_keys = {}
+
+
+def ko_keys(size: int):
+    """
+    Return the 64 bits random keys of the ko points of the padded board, indexed by point
+    """
+    if size not in _ko_keys:
+        generator = random.Random(ZOBRIST_SEED ^ (size << 8))
+        _ko_keys[size] = [
+            generator.getrandbits(64) for _ in range((size + 2) * (size + 2))
+        ]
+    return _ko_keys[size]
+
+
+def target_keys(size: int):
+    """
+    Return the 64 bits random keys of the target stones of the solver, indexed by point
+    """
+    if size not in _target_keys:
+        generator = random.Random(ZOBRIST_SEED ^ (size << 8) ^ 1)
+        _target_keys[size] = [
+            generator.getrandbits(64) for _ in range((size + 2) * (size + 2))
+        ]
+    return _target_keys[size]
+
+
+def position_key(size, position_hash, player, ko_point):
+    """
+    Key of a search position: the Zobrist hash of the stones, the player to move and the point forbidden by the ko
+    """
+    key = position_hash ^ TURN_KEYS[player]
+    if ko_point is not None:
+        key ^= ko_keys(size)[ko_point]
+    return key
+
+
+class TranspositionTable(object):
+    """
+    Bounded table of the search positions, shared by the Monte Carlo tree search and the capture solver
+    The entries are kept in preallocated arrays, one per field, so the memory never grows past the cap
+    A key can only be stored in the BUCKET slots of its bucket, when they are all used the replaced
+    entry is the one of the oldest generation, then the one with the smallest weight:
+    the largest of the visits of the tree search and the depth searched by the solver
+    The age of an entry is counted modulo the generations, so the order holds when the counter wraps
+    The generation is advanced before every search, the entries of the previous searches stay readable
+    but are the first to go
+    """
+
+    DEFAULT_MEMORY = 16 << 20  # bytes
+    BUCKET = 4  # slots a key can be stored in
+    # key, visits, wins, weight, generation, depth, value
+    ENTRY_BYTES = 8 + 8 + 8 + 8 + 2 + 1 + 1
+    GENERATIONS = 0xFFFF  # generations 1 to GENERATIONS, 0 marks the empty slots
+
+    def __init__(self, memory=DEFAULT_MEMORY):
+        self.buckets = max(1, memory // (self.ENTRY_BYTES * self.BUCKET))
+        capacity = self.buckets * self.BUCKET
+        self.keys = array("Q", bytes(8 * capacity))
+        self.visits = array("q", bytes(8 * capacity))
+        self.wins = array("q", bytes(8 * capacity))
+        self.weights = array("q", bytes(8 * capacity))
+        self.generations = array("H", bytes(2 * capacity))
+        self.depths = array("B", bytes(capacity))  # depth searched by the solver
+        # result of the solver, 0 when unknown
+        self.values = array("b", bytes(capacity))
+        self.generation = 1  # generation 0 marks the empty slots
+        self.used = 0
+
+    def __len__(self):
+        return self.used
+
+    def memory(self):
+        return len(self.keys) * self.ENTRY_BYTES
+
+    def new_generation(self):
+        """
+        Age the entries stored so far, called before every search
+        """
+        self.generation = self.generation % self.GENERATIONS + 1
+
+    def age(self, generation):
+        """
+        Return the number of generations since the given one, the current generation is 0
+        """
+        return (self.generation - generation) % self.GENERATIONS
+
+    def probe(self, key):
+        """
+        Return the slot of the key, -1 if it is not stored
+        """
+        start = key % self.buckets * self.BUCKET
+        keys, generations = self.keys, self.generations
+        for slot in range(start, start + self.BUCKET):
+            if keys[slot] == key and generations[slot]:
+                return slot
+        return -1
+
+    def store(self, key, weight):
+        """
+        Return the slot of the key, a slot of its bucket is given to it if needed and the entry
+        there is replaced, -1 when every entry of the bucket is of the current generation and heavier
+        """
+        keys, generations, weights = self.keys, self.generations, self.weights
+        slot = self.probe(key)
+        if slot != -1:
+            generations[slot] = self.generation
+            weights[slot] = max(weights[slot], weight)
+            return slot
+
+        # the slots of a bucket are filled in order and never emptied again
+        start = key % self.buckets * self.BUCKET
+        victim = start
+        for slot in range(start, start + self.BUCKET):
+            if not generations[slot]:
+                victim = slot
+                self.used += 1
+                break
+            if (self.age(generations[slot]), -weights[slot]) > (
+                self.age(generations[victim]),
+                -weights[victim],
+            ):
+                victim = slot
+
+        if generations[victim] == self.generation and weights[victim] > weight:
+            return -1
+
+        keys[victim] = key
+        generations[victim] = self.generation
+        weights[victim] = weight
+        self.visits[victim] = self.wins[victim] = self.depths[victim] = self.values[
+            victim
+        ] = 0
+        return victim
+
+    def statistics(self, key):
+        """
+        Return the (visits, wins) of the position summed over all the paths of the tree search
+        """
+        slot = self.probe(key)
+        if slot == -1:
+            return 0, 0
+        return self.visits[slot], self.wins[slot]
+
+    def add_result(self, key, win):
+        """
+        Count a playout through the position, the visits are the weight of the entry
+        """
+        slot = self.probe(key)
+        if slot == -1:
+            slot = self.store(key, 1)
+            if slot == -1:
+                return
+        self.visits[slot] += 1
+        self.wins[slot] += win
+        self.weights[slot] = max(self.weights[slot], self.visits[slot])
+        self.generations[slot] = self.generation
+
+    def result(self, key, depth):
+        """
+        Return the result of the solver searched at least as deep, 0 when unknown
+        """
+        slot = self.probe(key)
+        if slot == -1 or self.depths[slot] < depth:
+            return 0
+        return self.values[slot]
+
+    def store_result(self, key, depth, value):
+        slot = self.store(key, depth)
+        if slot != -1 and depth >= self.depths[slot]:
+            self.depths[slot] = depth
+            self.values[slot] = value
@@ -0,0 +1,202 @@
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from functools import partial
+from multiprocessing import Pool
+import sgf
+from piece import Piece
+from goban import Goban
+from game_logic import GameLogic
+
+_archives = {}  # zip files opened by a worker, kept open for its next files
+
+
+def find_sources(paths):
+    """
+    Yield (path, member) of every SGF file of the paths, member is None outside of a zip file
+    Directories are walked and zip files are opened to list their SGF members
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    full_path = os.path.join(root, name)
+                    if name.lower().endswith(".sgf"):
+                        yield full_path, None
+                    elif name.lower().endswith(".zip"):
+                        yield from zip_members(full_path)
+        elif path.lower().endswith(".zip"):
+            yield from zip_members(path)
+        else:
+            yield path, None
+
+
+def zip_members(path):
+    try:
+        archive = zipfile.ZipFile(path)
+    except (OSError, zipfile.BadZipFile):
+        # the worker opens it again and reports the error as an unreadable file
+        yield path, ""
+        return
+    with archive:
+        for name in archive.namelist():
+            if name.lower().endswith(".sgf"):
+                yield path, name
+
+
+def open_source(path, member):
+    if member is None:
+        return open(path, "r", encoding="utf-8", errors="replace")
+    if path not in _archives:
+        _archives[path] = zipfile.ZipFile(path)
+    return io.TextIOWrapper(
+        _archives[path].open(member), encoding="utf-8", errors="replace"
+    )
+
+
+def illegal_reason(logic, piece):
+    """
+    Say why the rules engine refuses the piece
+    """
+    if not logic.existing_position(*piece.position):
+        return "off board"
+    if logic.board.state(*piece.position) != 0:
+        return "occupied"
+    if logic.suicide(piece):
+        return "suicide"
+    if logic.ko(piece):
+        return "ko"
+    return "illegal"
+
+
+def replay_game(game, ko_rule):
+    """
+    Replay the main line of the game through the rules engine, the illegal moves are reported
+    and skipped, the final score is counted without removing the dead stones
+    """
+    logic = GameLogic(
+        Goban(game.size),
+        {
+            "player": 0,
+            "type": None,
+            "value": None,
+            "komi": game.komi,
+            "ko": ko_rule,
+            "size": game.size,
+        },
+    )
+    logic.start()
+    illegal = []
+
+    for number, (state, position) in enumerate(
+        game.setup + game.moves, 1 - len(game.setup)
+    ):
+        if position is None:
+            logic.pass_turn(state)
+            continue
+
+        piece = Piece(state, *position)
+        if logic.existing_position(*position) and logic.check_piece_placement(piece):
+            logic.capturing_territory(piece)
+        else:
+            illegal.append(
+                {
+                    "move": number,
+                    "point": sgf.format_point(position),
+                    "reason": illegal_reason(logic, piece),
+                }
+            )
+
+    logic.stop()
+    logic.count_territory()
+    white, black = logic.territory_scoring()
+
+    return {
+        "size": game.size,
+        "moves": len(game.moves),
+        "illegal": illegal,
+        "ko_violations": sum(1 for move in illegal if move["reason"] == "ko"),
+        "score": {"white": white, "black": black},
+        "winner": "W" if white > black else "B" if black > white else "0",
+        "result": game.result,
+    }
+
+
+def validate_source(source, ko_rule):
+    """
+    Replay every game of an SGF file, return one JSON line per game or unreadable file,
+    the number of games and the number of games with an error or an illegal move
+    """
+    path, member = source
+    name = path if not member else f"{path}:{member}"
+    lines = []
+    games = failed = 0
+    try:
+        with open_source(path, member) as f:
+            for index, game in enumerate(sgf.read_games(f)):
+                report = {"source": name, "game": index}
+                if game.error:
+                    report["error"] = game.error
+                elif not 2 <= game.size <= len(sgf.COORDINATES):
+                    report["error"] = f"unsupported board size {game.size}"
+                else:
+                    report.update(replay_game(game, ko_rule))
+                games += 1
+                failed += "error" in report or bool(report["illegal"])
+                lines.append(json.dumps(report))
+    except (OSError, ValueError, zipfile.BadZipFile) as error:
+        # the file itself could not be read, it is not counted as a game
+        lines.append(json.dumps({"source": name, "error": str(error)}))
+    return lines, games, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay SGF games through the rules engine and report illegal moves, ko violations and scores as JSON lines"
+    )
+    parser.add_argument("paths", nargs="+", help="SGF files, directories or zip files")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="worker processes"
+    )
+    parser.add_argument(
+        "--ko",
+        choices=GameLogic.KO_RULES,
+        default="Simple ko",
+        help="ko rule of the games",
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=16, help="files sent to a worker at once"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    files = games = failed_games = failed_files = 0
+
+    with Pool(args.workers) as pool:
+        for lines, source_games, failed in pool.imap_unordered(
+            partial(validate_source, ko_rule=args.ko),
+            find_sources(args.paths),
+            args.chunksize,
+        ):
+            files += 1
+            games += source_games
+            failed_games += failed
+            failed_files += len(lines) > source_games
+            sys.stdout.write("".join(line + "\n" for line in lines))
+            sys.stdout.flush()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{files} files ({failed_files} unreadable), {games} games, {failed_games} with errors"
+        f" in {elapsed:.1f} s"
+        f" ({games / elapsed:.0f} games/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import os
+import sys
+
+import pytest
+
+# the modules of the game import each other by their flat names
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "HGP_Group_12_Project", "code")
+)
+
+from goban import Goban  # noqa: E402
+from game_logic import GameLogic  # noqa: E402
+from piece import Piece  # noqa: E402
+
+WHITE, BLACK = 1, 2
+
+# ko shape in the top left corner, black captures on (1, 2), white takes back on (1, 1)
+KO_SHAPE = [
+    (BLACK, 0, 1),
+    (WHITE, 0, 2),
+    (BLACK, 2, 1),
+    (WHITE, 2, 2),
+    (BLACK, 1, 0),
+    (WHITE, 1, 3),
+    (WHITE, 1, 1),
+]
+
+
+def new_logic(size=9, ko="Simple ko", komi="6.5"):
+    logic = GameLogic(
+        Goban(size),
+        {
+            "player": 0,
+            "type": None,
+            "value": None,
+            "komi": komi,
+            "ko": ko,
+            "size": size,
+        },
+    )
+    logic.start()
+    return logic
+
+
+def play(logic, state, row, col):
+    """
+    Play a legal move and return the captured positions
+    """
+    piece = Piece(state, row, col)
+    assert logic.check_piece_placement(piece), f"{piece} should be legal"
+    return logic.capturing_territory(piece)
+
+
+def play_all(logic, moves):
+    for state, row, col in moves:
+        play(logic, state, row, col)
+
+
+def is_legal(logic, state, row, col):
+    return logic.check_piece_placement(Piece(state, row, col))
+
+
+@pytest.fixture
+def logic():
+    return new_logic()
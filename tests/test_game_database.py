@@ -0,0 +1,97 @@
+import pytest
+
+from game_database import GameDatabase
+
+
+def finished_game(**fields):
+    game = {
+        "date": "2024-05-01T10:00:00",
+        "white": "Alice",
+        "black": "Bob",
+        "size": 9,
+        "handicap_type": None,
+        "handicap_player": 0,
+        "handicap_value": None,
+        "komi": 6.5,
+        "ko_rule": "Simple ko",
+        "result_type": "score",
+        "winner": 1,
+        "white_score": 40.5,
+        "black_score": 34,
+        "duration": 600.0,
+        "final_hash": 0xFFFF_FFFF_FFFF_FFFF,
+        "moves": [(2, (2, 2)), (1, (6, 6)), (2, None)],
+    }
+    game.update(fields)
+    return game
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = GameDatabase(str(tmp_path / "games.sqlite3"))
+    yield database
+    database.close()
+
+
+def test_a_game_is_stored_with_its_moves_and_hash(database):
+    database.add_game(finished_game())
+
+    (row,) = database.games_with_position(0xFFFF_FFFF_FFFF_FFFF)
+    assert row["moves"] == ";B[cc];W[gg];B[]"
+    assert (row["white"], row["black"], row["winner"]) == ("Alice", "Bob", 1)
+
+
+def test_queries_return_the_last_games_first(database):
+    database.add_game(finished_game(date="2024-05-01", result_type="resign"))
+    database.add_game(finished_game(date="2024-05-03", white="Bob", black="Carol"))
+    database.add_game(finished_game(date="2024-05-02", result_type="timeout"))
+
+    assert database.count() == 3
+    assert [row["date"] for row in database.games_by_player("Bob")] == [
+        "2024-05-03",
+        "2024-05-02",
+        "2024-05-01",
+    ]
+    assert len(database.games_by_player("Carol")) == 1
+    assert [
+        row["date"] for row in database.games_between("2024-05-02", "2024-05-03")
+    ] == [
+        "2024-05-03",
+        "2024-05-02",
+    ]
+    assert len(database.games_with_result("timeout", winner=1)) == 1
+    assert database.games_with_result("timeout", winner=2) == []
+
+
+def test_games_wait_for_the_batch_unless_it_holds_one_game(tmp_path):
+    path = str(tmp_path / "games.sqlite3")
+    batched = GameDatabase(path, batch_size=10)
+    single = GameDatabase(path, batch_size=1)
+    reader = GameDatabase(path)
+
+    batched.add_game(finished_game())
+    assert reader.count() == 0
+    single.add_game(finished_game())
+    assert reader.count() == 1
+    batched.close()
+    assert reader.count() == 2
+
+    single.close()
+    reader.close()
+
+
+def test_the_result_query_uses_the_result_index(database):
+    plan = database.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM games WHERE result_type = ? AND winner = ?"
+        " ORDER BY date DESC, id DESC LIMIT 10",
+        ("score", 1),
+    ).fetchall()
+
+    details = " ".join(row["detail"] for row in plan)
+    assert "games_result_date" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_unknown_result_type_is_refused(database):
+    with pytest.raises(ValueError):
+        database.add_game(finished_game(result_type="draw"))
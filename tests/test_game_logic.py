@@ -0,0 +1,65 @@
+from conftest import BLACK, WHITE, play, play_all, is_legal
+from piece import Piece
+
+
+def test_single_stone_capture(logic):
+    play_all(logic, [(WHITE, 4, 4), (BLACK, 3, 4), (BLACK, 5, 4), (BLACK, 4, 3)])
+
+    assert play(logic, BLACK, 4, 5) == [(4, 4)]
+    assert logic.board.state(4, 4) == 0
+    assert logic.count_prisoners() == (0, 1)
+
+
+def test_group_capture_in_the_corner(logic):
+    play_all(logic, [(WHITE, 0, 0), (WHITE, 0, 1), (BLACK, 1, 0), (BLACK, 1, 1)])
+
+    captured = play(logic, BLACK, 0, 2)
+
+    assert sorted(captured) == [(0, 0), (0, 1)]
+    assert logic.count_prisoners() == (0, 2)
+
+
+def test_one_move_captures_two_groups(logic):
+    play_all(
+        logic,
+        [
+            (WHITE, 0, 0),
+            (WHITE, 0, 2),
+            (BLACK, 1, 0),
+            (BLACK, 1, 2),
+            (BLACK, 0, 3),
+        ],
+    )
+
+    assert sorted(play(logic, BLACK, 0, 1)) == [(0, 0), (0, 2)]
+
+
+def test_suicide_is_illegal(logic):
+    play_all(logic, [(BLACK, 0, 1), (BLACK, 1, 0)])
+
+    assert logic.suicide(Piece(WHITE, 0, 0))
+    assert not is_legal(logic, WHITE, 0, 0)
+    assert is_legal(logic, BLACK, 0, 0)
+
+
+def test_group_suicide_is_illegal(logic):
+    play_all(logic, [(WHITE, 0, 0), (BLACK, 1, 0), (BLACK, 1, 1), (BLACK, 0, 2)])
+
+    assert not is_legal(logic, WHITE, 0, 1)
+
+
+def test_filling_the_last_liberty_is_legal_when_it_captures(logic):
+    play_all(
+        logic,
+        [(BLACK, 0, 1), (BLACK, 1, 0), (WHITE, 1, 1), (WHITE, 0, 2), (WHITE, 2, 0)],
+    )
+
+    assert is_legal(logic, WHITE, 0, 0)
+    assert sorted(play(logic, WHITE, 0, 0)) == [(0, 1), (1, 0)]
+
+
+def test_occupied_point_is_illegal(logic):
+    play(logic, BLACK, 4, 4)
+
+    assert not is_legal(logic, WHITE, 4, 4)
+    assert not is_legal(logic, BLACK, 4, 4)
@@ -0,0 +1,38 @@
+import pytest
+
+from goban import BORDER, Goban
+
+
+@pytest.mark.parametrize("size", [9, 13, 19])
+def test_point_and_position_round_trip(size):
+    board = Goban(size)
+
+    assert [board.position(point) for point in board.points()] == [
+        (row, col) for row in range(size) for col in range(size)
+    ]
+
+
+def test_every_point_has_four_neighbors_on_the_padded_board():
+    board = Goban(9)
+
+    for point in board.points():
+        assert all(
+            0 <= neighbor < len(board.cells) for neighbor in board.neighbors(point)
+        )
+    assert board.cells[board.neighbors(board.point(0, 0))[0]] == BORDER
+    assert board.cells.count(0) == 81
+
+
+def test_copy_is_independent():
+    board = Goban(9)
+    copy = board.copy()
+    copy.cells[copy.point(4, 4)] = 2
+
+    assert board.state(4, 4) == 0
+    assert copy[4, 4].state == 2
+
+
+def test_star_points():
+    assert Goban(5).star_points() == []
+    assert sorted(Goban(9).star_points()) == [(2, 2), (2, 6), (4, 4), (6, 2), (6, 6)]
+    assert len(Goban(19).star_points()) == 9
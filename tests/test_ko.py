@@ -0,0 +1,53 @@
+import pytest
+
+from conftest import BLACK, KO_SHAPE, WHITE, new_logic, play, play_all, is_legal
+from group_table import TURN_KEYS
+from piece import Piece
+
+
+@pytest.mark.parametrize(
+    "ko", ["Simple ko", "Positional superko", "Situational superko"]
+)
+def test_ko_forbids_the_immediate_retake(ko):
+    logic = new_logic(ko=ko)
+    play_all(logic, KO_SHAPE)
+    assert play(logic, BLACK, 1, 2) == [(1, 1)]
+
+    assert logic.ko(Piece(WHITE, 1, 1))
+    assert not is_legal(logic, WHITE, 1, 1)
+    assert logic.ko_point() == logic.board.point(1, 1)
+
+
+@pytest.mark.parametrize(
+    "ko", ["Simple ko", "Positional superko", "Situational superko"]
+)
+def test_ko_can_be_taken_back_after_a_threat(ko):
+    logic = new_logic(ko=ko)
+    play_all(logic, KO_SHAPE)
+    play(logic, BLACK, 1, 2)
+    play_all(logic, [(WHITE, 6, 6), (BLACK, 6, 5)])
+
+    assert play(logic, WHITE, 1, 1) == [(1, 2)]
+
+
+def test_superko_rules_differ_on_the_player_to_move():
+    """
+    Black captures a white stone and gives a position with white to move, after the ko is taken
+    and taken back the same stones come back with black to move: a repeated position but a new
+    situation
+    """
+    results = {}
+    for ko in ("Positional superko", "Situational superko"):
+        logic = new_logic(ko=ko)
+        play_all(logic, KO_SHAPE + [(WHITE, 8, 8), (BLACK, 7, 8)])
+        play(logic, BLACK, 8, 7)  # captures on (8, 8), white to move
+        logic.pass_turn(WHITE)
+        play(logic, BLACK, 1, 2)
+        results[ko] = is_legal(logic, WHITE, 1, 1)
+
+    assert results == {"Positional superko": False, "Situational superko": True}
+
+
+def test_turn_keys_are_distinct():
+    assert len(set(TURN_KEYS)) == len(TURN_KEYS)
+    assert TURN_KEYS[0] == 0
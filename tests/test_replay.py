@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from conftest import BLACK, new_logic, play, is_legal
+from replay import GameReplay
+
+
+def random_game(seed, length=100):
+    """
+    Play a random game and return its moves with the cells and prisoners after each move
+    """
+    rng = random.Random(seed)
+    logic = new_logic(size=9)
+    positions = [(bytes(logic.board.cells), logic.count_prisoners())]
+    state = BLACK
+    for _ in range(length):
+        legal = [
+            (row, col)
+            for row in range(9)
+            for col in range(9)
+            if is_legal(logic, state, row, col)
+        ]
+        if rng.random() < 0.05 or not legal:
+            logic.pass_turn(state)
+        else:
+            play(logic, state, *rng.choice(legal))
+        positions.append((bytes(logic.board.cells), logic.count_prisoners()))
+        state = 3 - state
+    return logic.moves(), positions
+
+
+@pytest.mark.parametrize("interval", [1, 4, 16])
+def test_seek_shows_the_position_after_the_move(interval):
+    moves, positions = random_game(0)
+    replay = GameReplay(9, moves, interval)
+    rng = random.Random(1)
+
+    # backwards, forwards, one step at a time and random jumps
+    order = list(range(len(moves), -1, -1)) + list(range(len(moves) + 1))
+    order += [rng.randrange(len(moves) + 1) for _ in range(50)]
+    for move_number in order:
+        replay.seek(move_number)
+
+        assert replay.move_number == move_number
+        assert (bytes(replay.board.cells), tuple(replay.prisoners[1:])) == positions[
+            move_number
+        ]
+
+
+def test_seek_clamps_to_the_recorded_moves():
+    moves, positions = random_game(2, length=10)
+    replay = GameReplay(9, moves)
+
+    replay.seek(-5)
+    assert replay.move_number == 0
+    replay.seek(len(moves) + 5)
+    assert replay.move_number == len(moves)
+    assert bytes(replay.board.cells) == positions[-1][0]
@@ -0,0 +1,109 @@
+import pytest
+
+from conftest import new_logic, play_all
+from mcts import MonteCarloTreeSearch, ParallelSearch, PlayoutBoard
+
+
+def middle_game():
+    logic = new_logic(size=9)
+    play_all(
+        logic,
+        [
+            (2, 2, 2),
+            (1, 6, 6),
+            (2, 2, 6),
+            (1, 6, 2),
+            (2, 4, 4),
+            (1, 4, 5),
+            (2, 3, 5),
+            (1, 5, 4),
+        ],
+    )
+    return logic
+
+
+def assert_legal(logic, player, point):
+    assert point is None or logic.legal_moves(player)[point] == 1
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_search_returns_a_legal_move(seed):
+    logic = middle_game()
+    search = MonteCarloTreeSearch(9, logic.komi(), seed=seed)
+
+    point = search.search(
+        bytes(logic.board.cells),
+        2,
+        bytes(logic.legal_moves(2)),
+        thinking_time=5.0,
+        max_visits=200,
+    )
+
+    assert_legal(logic, 2, point)
+    assert search.root.visits >= 200
+
+
+def test_search_only_plays_the_moves_of_the_mask():
+    logic = middle_game()
+    mask = bytearray(len(logic.board.cells))
+    allowed = {logic.board.point(0, 0), logic.board.point(8, 8)}
+    for point in allowed:
+        mask[point] = 1
+    search = MonteCarloTreeSearch(9, logic.komi(), seed=0)
+
+    point = search.search(
+        bytes(logic.board.cells),
+        2,
+        bytes(mask),
+        thinking_time=5.0,
+        allow_pass=False,
+        max_visits=100,
+    )
+
+    assert point in allowed
+
+
+def test_search_stops_when_asked():
+    logic = middle_game()
+    search = MonteCarloTreeSearch(9, logic.komi(), seed=0)
+
+    search.search(
+        bytes(logic.board.cells),
+        2,
+        bytes(logic.legal_moves(2)),
+        thinking_time=60.0,
+        stop=lambda: search.playouts >= 5,
+    )
+
+    assert search.playouts == 5
+
+
+def test_playout_board_copy_is_independent():
+    logic = middle_game()
+    board = PlayoutBoard(9, logic.board.cells)
+    cells, position_hash = bytes(board.colors), board.groups.hash
+
+    copy = board.copy()
+    copy.play(logic.board.point(0, 0), 1)
+
+    assert bytes(board.colors) == cells and board.groups.hash == position_hash
+    assert copy.groups.hash != position_hash
+    assert logic.board.point(0, 0) in board.empty
+
+
+def test_parallel_search_returns_a_legal_move():
+    logic = middle_game()
+    search = ParallelSearch(9, logic.komi(), workers=2, memory=1 << 20)
+    try:
+        point = search.search(
+            bytes(logic.board.cells),
+            2,
+            bytes(logic.legal_moves(2)),
+            thinking_time=0.5,
+        )
+    finally:
+        search.close()
+
+    assert_legal(logic, 2, point)
+    assert search.playouts > 0
+    assert search.elapsed < 5.0
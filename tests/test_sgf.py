@@ -0,0 +1,154 @@
+import io
+
+import pytest
+
+import game_record
+import sgf
+from conftest import new_logic, play_all
+
+
+def write(game):
+    stream = io.StringIO()
+    sgf.write_game(game, stream)
+    return stream.getvalue()
+
+
+def read(text):
+    return list(sgf.read_games(io.StringIO(text)))
+
+
+def test_round_trip():
+    game = sgf.SgfGame(9)
+    game.komi = 5.5
+    game.handicap = 2
+    game.black = "Black [strong]"
+    game.white = "White \\ player"
+    game.result = "W+R"
+    game.date = "2024-05-01"
+    game.setup = [(2, (2, 2)), (2, (6, 6)), (1, (4, 4))]
+    game.moves = [(1, (2, 6)), (2, None), (1, (6, 2)), (2, (8, 8))] * 4
+
+    (loaded,) = read(write(game))
+
+    for field in ("size", "komi", "handicap", "black", "white", "result", "date"):
+        assert getattr(loaded, field) == getattr(game, field)
+    assert sorted(loaded.setup) == sorted(game.setup)
+    assert loaded.moves == game.moves
+    assert not loaded.error
+
+
+def test_round_trip_of_a_played_game():
+    logic = new_logic(size=13)
+    play_all(logic, [(2, 3, 3), (1, 9, 9), (2, 3, 9), (1, 9, 3)])
+    logic.pass_turn(2)
+    game = sgf.SgfGame(13)
+    game.moves = logic.moves()
+
+    (loaded,) = read(write(game))
+
+    assert loaded.moves == logic.moves()
+
+
+def test_handicap_stones_are_setup_stones():
+    game = sgf.SgfGame(9)
+    game.handicap = 2
+    game.setup = [(2, (2, 2)), (2, (6, 6))]
+    game.moves = [(1, (4, 4))]
+
+    text = write(game)
+
+    assert "AB[cc][gg]" in text
+    assert ";B[" not in text
+    (loaded,) = read(text)
+    assert loaded.setup == game.setup and loaded.moves == game.moves
+
+
+def test_tt_is_a_pass_on_small_boards():
+    (game,) = read("(;SZ[9];B[tt];W[])")
+
+    assert game.moves == [(2, None), (1, None)]
+
+
+@pytest.mark.parametrize("point", ["za", "iz", "jj"])
+def test_points_off_the_board_are_kept_for_the_caller_to_reject(point):
+    (game,) = read(f"(;SZ[9];B[cc];W[{point}])")
+    logic = new_logic(size=9)
+
+    state, position = game.moves[-1]
+
+    assert position == sgf.parse_point(point, 9)
+    assert not logic.existing_position(*position)
+    assert logic.existing_position(*game.moves[0][1])
+
+
+def test_invalid_point_spoils_only_its_game():
+    games = read("(;SZ[9];B[cc];W[a1])(;SZ[9];B[dd])")
+
+    assert games[0].error == "Invalid point a1"
+    assert not games[1].error and games[1].moves == [(2, (3, 3))]
+
+
+def test_bad_header_spoils_only_its_game():
+    games = read("(;SZ[x9];B[aa])(;SZ[9]KM[abc];B[cc])(;SZ[9];B[cc];W[dd])")
+
+    assert [bool(game.error) for game in games] == [True, True, False]
+    assert games[2].moves == [(2, (2, 2)), (1, (3, 3))]
+
+
+def test_load_raises_on_a_bad_game(tmp_path):
+    path = tmp_path / "bad.sgf"
+    path.write_text("(;SZ[9]KM[abc];B[cc])")
+
+    with pytest.raises(ValueError):
+        sgf.load(str(path))
+
+
+def test_variations_are_skipped():
+    (game,) = read("(;SZ[9];B[aa](;W[bb];B[cc])(;W[dd]))")
+
+    assert game.moves == [(2, (0, 0)), (1, (1, 1)), (2, (2, 2))]
+
+
+def test_nodes_across_chunks(monkeypatch):
+    game = sgf.SgfGame(19)
+    game.moves = [(1 + index % 2, (index % 19, index * 7 % 19)) for index in range(300)]
+    text = write(game)
+    monkeypatch.setattr(sgf, "CHUNK_SIZE", 7)
+
+    (loaded,) = read(text)
+
+    assert loaded.moves == game.moves
+
+
+def test_load_and_save_keep_the_handicap_stones():
+    (game,) = read("(;SZ[9]HA[2]AB[cc][gg];W[ee];B[ec])")
+
+    logic, handicap = game_record.load_game(game, "Simple ko")
+    saved = write(game_record.save_game(logic, handicap))
+    (loaded,) = read(saved)
+
+    assert logic.handicap_moves() == [(2, (2, 2)), (2, (6, 6))]
+    assert "HA[2]" in saved and "AB[cc][gg]" in saved
+    assert ";B[cc]" not in saved
+    assert (loaded.handicap, loaded.setup, loaded.moves) == (
+        2,
+        game.setup,
+        game.moves,
+    )
+
+
+def test_setup_stones_of_a_loaded_game_are_not_taken_back():
+    (game,) = read("(;SZ[9]HA[2]AB[cc][gg];W[ee];B[ec])")
+    logic, _ = game_record.load_game(game, "Simple ko")
+
+    assert logic.undo() is not None
+    assert logic.undo() is not None
+    assert not logic.can_undo()
+    assert logic.board.state(2, 2) == logic.board.state(6, 6) == 2
+
+
+def test_loading_an_illegal_move_fails():
+    (game,) = read("(;SZ[9];B[ee];W[ee])")
+
+    with pytest.raises(ValueError, match="Illegal move ee"):
+        game_record.load_game(game, "Simple ko")
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from conftest import BLACK, WHITE, new_logic, play, play_all, is_legal
+from goban import Goban
+from territory import TerritoryIndex
+
+
+def flood_fill_territory(board):
+    """
+    Territory of each player counted from scratch with a flood fill over the (row, col) positions
+    """
+    territory = [0, 0, 0]
+    seen = set()
+    for row in range(board.size):
+        for col in range(board.size):
+            if board.state(row, col) or (row, col) in seen:
+                continue
+            region, owners = [(row, col)], set()
+            seen.add((row, col))
+            for r, c in region:
+                for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                    if not (0 <= nr < board.size and 0 <= nc < board.size):
+                        continue
+                    state = board.state(nr, nc)
+                    if state:
+                        owners.add(state)
+                    elif (nr, nc) not in seen:
+                        seen.add((nr, nc))
+                        region.append((nr, nc))
+            if len(owners) == 1:
+                territory[owners.pop()] += len(region)
+    return territory[1], territory[2]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_incremental_territory_matches_a_full_flood_fill(seed):
+    rng = random.Random(seed)
+    logic = new_logic(size=9)
+    board = logic.board
+    index = TerritoryIndex(board)
+    state = BLACK
+    for _ in range(120):
+        legal = [
+            (row, col)
+            for row in range(9)
+            for col in range(9)
+            if is_legal(logic, state, row, col)
+        ]
+        if not legal:
+            break
+        before = bytes(board.cells)
+        play(logic, state, *rng.choice(legal))
+        state = 3 - state
+
+        index.update(
+            [point for point in board.points() if board.cells[point] != before[point]]
+        )
+        assert tuple(index.territory[1:]) == flood_fill_territory(board)
+
+
+def test_index_of_an_empty_board_has_no_owner():
+    index = TerritoryIndex(Goban(9))
+
+    assert index.territory == [0, 0, 0]
+
+
+def test_territory_scoring():
+    """
+    Black wall on the third column, white wall on the fourth, on a 5x5 board
+    """
+    logic = new_logic(size=5, komi="0.5")
+    for row in range(5):
+        play(logic, BLACK, row, 2)
+        play(logic, WHITE, row, 3)
+
+    assert logic.count_territory() == (5, 10)
+    assert logic.territory_scoring() == (5.5, 10)
+    assert logic.area_scoring() == (10.5, 15)
+
+
+def test_territory_scoring_takes_the_prisoners_off():
+    logic = new_logic(size=5, komi="0.5")
+    for row in range(5):
+        play(logic, BLACK, row, 2)
+        play(logic, WHITE, row, 3)
+    play_all(logic, [(WHITE, 0, 0), (BLACK, 1, 0)])
+    play(logic, BLACK, 0, 1)  # captures the white stone on (0, 0)
+
+    white, black = logic.count_territory()
+    assert (white, black) == (5, 8)
+    assert logic.territory_scoring() == (white - 1 + 0.5, black)
@@ -0,0 +1,43 @@
+from transposition import TranspositionTable, position_key
+
+
+def test_transposition_table_evicts_the_oldest_entries_first():
+    table = TranspositionTable(
+        memory=TranspositionTable.ENTRY_BYTES * TranspositionTable.BUCKET
+    )
+    table.generation = TranspositionTable.GENERATIONS - 1
+    table.store(1, 100)  # oldest, heaviest
+    table.new_generation()
+    table.store(2, 5)
+    table.new_generation()  # the counter wraps
+    table.store(3, 1)
+    table.store(4, 1)
+
+    table.store(5, 1)
+    assert table.probe(1) == -1
+    table.store(6, 1)
+    assert table.probe(2) == -1
+    assert all(table.probe(key) != -1 for key in (3, 4, 5, 6))
+
+
+def test_playout_results_and_solver_results_share_the_entry():
+    table = TranspositionTable(memory=1 << 16)
+
+    table.add_result(7, 1)
+    table.add_result(7, 0)
+    table.store_result(7, 3, 1)
+
+    assert table.statistics(7) == (2, 1)
+    assert table.result(7, 3) == 1
+    assert table.result(7, 4) == 0  # not searched deep enough
+    assert table.statistics(8) == (0, 0)
+
+
+def test_position_key_depends_on_the_player_and_the_ko_point():
+    keys = {
+        position_key(9, 12345, player, ko_point)
+        for player in (1, 2)
+        for ko_point in (None, 20, 21)
+    }
+
+    assert len(keys) == 6
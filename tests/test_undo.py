@@ -0,0 +1,47 @@
+from conftest import BLACK, KO_SHAPE, WHITE, play, play_all, is_legal
+
+
+def snapshot(logic):
+    return bytes(logic.board.cells), logic.position_hash(), logic.count_prisoners()
+
+
+def test_undo_redo_round_trip(logic):
+    moves = KO_SHAPE + [(BLACK, 1, 2), (WHITE, 6, 6), (BLACK, 6, 5), (WHITE, 1, 1)]
+    snapshots = [snapshot(logic)]
+    for state, row, col in moves:
+        play(logic, state, row, col)
+        snapshots.append(snapshot(logic))
+    logic.pass_turn(BLACK)
+    snapshots.append(snapshot(logic))
+
+    for expected in reversed(snapshots[:-1]):
+        assert logic.undo() is not None
+        assert snapshot(logic) == expected
+    assert not logic.can_undo()
+    assert logic.undo() is None
+
+    for expected in snapshots[1:]:
+        assert logic.redo() is not None
+        assert snapshot(logic) == expected
+    assert not logic.can_redo()
+    assert logic.moves()[-1] == (BLACK, None)
+
+
+def test_undo_restores_the_ko(logic):
+    play_all(logic, KO_SHAPE)
+    play(logic, BLACK, 1, 2)
+    play(logic, WHITE, 6, 6)
+
+    logic.undo()
+
+    assert not is_legal(logic, WHITE, 1, 1)
+    assert is_legal(logic, WHITE, 6, 6)
+
+
+def test_a_new_move_drops_the_moves_taken_back(logic):
+    play_all(logic, [(BLACK, 2, 2), (WHITE, 3, 3)])
+    logic.undo()
+    play(logic, WHITE, 6, 6)
+
+    assert not logic.can_redo()
+    assert logic.moves() == [(BLACK, (2, 2)), (WHITE, (6, 6))]
@@ -0,0 +1,62 @@
+import json
+import zipfile
+
+from validate_games import find_sources, validate_source
+
+GAME = "(;SZ[9]KM[6.5];B[ee];W[cc];B[gg])"
+
+
+def validate(path, member=None):
+    lines, games, failed = validate_source((str(path), member), "Simple ko")
+    return [json.loads(line) for line in lines], games, failed
+
+
+def test_a_legal_game(tmp_path):
+    path = tmp_path / "game.sgf"
+    path.write_text(GAME)
+
+    (report,), games, failed = validate(path)
+
+    assert (games, failed) == (1, 0)
+    assert report["moves"] == 3 and report["illegal"] == []
+    assert report["source"] == str(path) and report["game"] == 0
+
+
+def test_illegal_moves_and_bad_games_are_reported_one_by_one(tmp_path):
+    path = tmp_path / "games.sgf"
+    # ko shape, black takes on dc and white takes back at once on cc
+    ko = "(;SZ[9];B[bc];W[cc];B[cb];W[db];B[cd];W[dd];B[ab];W[ec];B[dc];W[cc])"
+    path.write_text(f"(;SZ[9];B[ee];W[ee])(;SZ[x9];B[aa]){GAME}{ko}")
+
+    reports, games, failed = validate(path)
+
+    assert (games, failed) == (4, 3)
+    assert reports[0]["illegal"] == [{"move": 2, "point": "ee", "reason": "occupied"}]
+    assert "error" in reports[1]
+    assert reports[2]["illegal"] == []
+    assert reports[3]["ko_violations"] == 1
+
+
+def test_zip_members(tmp_path):
+    path = tmp_path / "games.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("a.sgf", GAME)
+        archive.writestr("b.sgf", GAME + GAME)
+        archive.writestr("notes.txt", "not a game")
+
+    sources = list(find_sources([str(tmp_path)]))
+
+    assert sources == [(str(path), "a.sgf"), (str(path), "b.sgf")]
+    assert [validate(*source)[1] for source in sources] == [1, 2]
+
+
+def test_unreadable_files_are_not_counted_as_games(tmp_path):
+    path = tmp_path / "broken.zip"
+    path.write_bytes(b"not a zip file")
+
+    (source,) = find_sources([str(path)])
+    reports, games, failed = validate(*source)
+
+    assert (games, failed) == (0, 0)
+    assert len(reports) == 1 and "error" in reports[0]
+    assert validate(tmp_path / "missing.sgf")[1] == 0